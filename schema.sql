@@ -99,6 +99,8 @@ CREATE INDEX idx_record_disease ON disease_records (disease_id);
 CREATE INDEX idx_record_region ON disease_records (region);
 CREATE INDEX idx_record_time ON disease_records (time);
 CREATE INDEX idx_record_time_disease_country ON disease_records (time, disease_id, country_id);
+-- Covering index for per-country quality checks (index-only scans); safe to apply to existing databases:
+CREATE INDEX IF NOT EXISTS idx_record_country_covering ON disease_records (country_id) INCLUDE (cases, deaths, time, data_source);
 
 CREATE TABLE reports (
 	title VARCHAR(500) NOT NULL, 
@@ -61,6 +61,7 @@ def upgrade() -> None:
     op.create_index('idx_task_report', 'tasks', ['report_id'])
     op.create_index('idx_task_parent', 'tasks', ['parent_task_id'])
     op.create_index('idx_task_created', 'tasks', ['created_at'])
+    op.create_index('idx_task_type_created', 'tasks', ['task_type', sa.text('created_at DESC')])
     
     # 创建任务工作簿表
     op.create_table(
@@ -128,6 +129,7 @@ def downgrade() -> None:
     op.drop_table('task_workbook')
     
     # 删除任务表
+    op.drop_index('idx_task_type_created', 'tasks')
     op.drop_index('idx_task_created', 'tasks')
     op.drop_index('idx_task_parent', 'tasks')
     op.drop_index('idx_task_report', 'tasks')
@@ -216,13 +216,16 @@ class TaskManager:
         task_type: Optional[TaskType] = None,
         country_id: Optional[int] = None,
         limit: int = 10,
+        task_types: Optional[List[TaskType]] = None,
     ) -> List[Task]:
-        """获取待处理的任务"""
+        """获取待处理的任务（task_types 可按多个任务类型过滤）"""
         async with get_db() as db:
             query = select(Task).where(Task.status == TaskStatus.PENDING)
             
             if task_type:
                 query = query.where(Task.task_type == task_type)
+            if task_types:
+                query = query.where(Task.task_type.in_(task_types))
             if country_id:
                 query = query.where(Task.country_id == country_id)
             
@@ -263,6 +266,25 @@ class TaskManager:
             result = await db.execute(query)
             return list(result.scalars().all())
     
+    async def get_workbooks_for_tasks(self, task_uuids: List[str]) -> Dict[str, List[TaskWorkbook]]:
+        """批量获取多个任务的工作簿（单次查询，按任务UUID分组）"""
+        if not task_uuids:
+            return {}
+        
+        async with get_db() as db:
+            query = (
+                select(TaskWorkbook, Task.task_uuid)
+                .join(Task, TaskWorkbook.task_id == Task.id)
+                .where(Task.task_uuid.in_(task_uuids))
+                .order_by(TaskWorkbook.created_at.asc())
+            )
+            
+            result = await db.execute(query)
+            workbooks: Dict[str, List[TaskWorkbook]] = {task_uuid: [] for task_uuid in task_uuids}
+            for entry, task_uuid in result:
+                workbooks[task_uuid].append(entry)
+            return workbooks
+    
     async def get_task_statistics(self) -> Dict[str, Any]:
         """获取任务统计信息"""
         async with get_db() as db:
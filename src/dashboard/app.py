@@ -159,7 +159,7 @@ if page == nav_labels[0]:
         
         with col_disease:
             # 获取疾病列表供用户选择
-            disease_names, disease_map = get_disease_list(sel_country_id)
+            disease_names, disease_map = get_disease_list(sel_country_id, st.session_state.get("lang", "en"))
             if disease_names:
                 disease_options = [t("all_diseases")] + disease_names
                 selected_disease_display = st.selectbox(t("disease_filter"), disease_options)
@@ -219,7 +219,7 @@ elif page == nav_labels[1]:
         st.warning(t("select_country"))
     else:
         # 获取有数据的疾病列表
-        disease_names, disease_map = get_disease_list(sel_country_id)
+        disease_names, disease_map = get_disease_list(sel_country_id, st.session_state.get("lang", "en"))
         if disease_names:
             # 显示疾病数量
             st.info(f"{t('available_diseases')}: {len(disease_names)}")
@@ -448,7 +448,7 @@ elif page == nav_labels[2]:
         t("template_disease_summary"): f"SELECT d.name, COUNT(*) as records, SUM(r.cases) as total_cases, SUM(r.deaths) as total_deaths FROM disease_records r JOIN diseases d ON r.disease_id=d.id WHERE r.country_id={sel_country_id or 1} GROUP BY d.name ORDER BY total_cases DESC",
         t("template_disease_summary"): "time_completeness_check",  # 特殊标识符，表示这是疾病汇总统计
         t("template_monthly_stats"): f"SELECT date_trunc('month', time) as month, SUM(cases) as cases, SUM(deaths) as deaths FROM disease_records WHERE country_id={sel_country_id or 1} GROUP BY month ORDER BY month DESC LIMIT 24",
-        t("template_data_quality"): f"SELECT COUNT(*) as total_records, COUNT(DISTINCT disease_id) as unique_diseases, MIN(time) as earliest, MAX(time) as latest, COUNT(CASE WHEN cases = 0 THEN 1 END) as zero_cases FROM disease_records WHERE country_id={sel_country_id or 1}"
+        t("template_data_quality"): f"SELECT COUNT(*) as total_records, COUNT(DISTINCT disease_id) as unique_diseases, MIN(time) as earliest, MAX(time) as latest, COUNT(*) FILTER (WHERE cases = 0) as zero_cases FROM disease_records WHERE country_id={sel_country_id or 1}"
     }
     
     selected_template = st.selectbox(t("select_template"), list(query_templates.keys()))
@@ -458,7 +458,7 @@ elif page == nav_labels[2]:
         st.subheader(t("time_completeness"))
         
         # 选择疾病
-        disease_names, disease_map = get_disease_list(sel_country_id or 1)
+        disease_names, disease_map = get_disease_list(sel_country_id or 1, st.session_state.get("lang", "en"))
         
         if disease_names:
             disease_options = [t("all_diseases")] + disease_names
@@ -719,11 +719,11 @@ else:
         # 数据质量检查
         st.subheader(t("quality_checks"))
         
-        # 1. 零值统计
+        # 1. 零值统计（FILTER 聚合可走 idx_record_country_covering 覆盖索引）
         zero_stats = run_query(f"""
             SELECT 
-                COUNT(CASE WHEN cases = 0 THEN 1 END) as zero_cases,
-                COUNT(CASE WHEN deaths = 0 THEN 1 END) as zero_deaths,
+                COUNT(*) FILTER (WHERE cases = 0) as zero_cases,
+                COUNT(*) FILTER (WHERE deaths = 0) as zero_deaths,
                 COUNT(*) as total
             FROM disease_records
             WHERE country_id = {sel_country_id}
@@ -1,4 +1,4 @@
-"""Async helper utilities for task operations in Streamlit.
+"""Async helper utilities for running coroutines from Streamlit.
 
 This module provides a persistent event loop in a background thread
 for executing async operations from Streamlit's synchronous context.
@@ -6,8 +6,11 @@ for executing async operations from Streamlit's synchronous context.
 import asyncio
 import atexit
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Any, Coroutine
-from functools import wraps
+from functools import _make_key, wraps
 
 
 class _AsyncExecutor:
@@ -33,9 +36,12 @@ class _AsyncExecutor:
     
     def _start_loop(self):
         """Start the event loop in a background thread."""
+        ready = threading.Event()
+        
         def run_loop():
             self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
+            self._loop.call_soon(ready.set)
             self._loop.run_forever()
         
         self._thread = threading.Thread(
@@ -45,24 +51,33 @@ class _AsyncExecutor:
         )
         self._thread.start()
         
-        # Wait for loop to be ready
-        while self._loop is None:
-            threading.Event().wait(0.01)
+        # Wait for loop to be running
+        ready.wait()
     
-    def run_async(self, coro: Coroutine) -> Any:
-        """Execute a coroutine in the background event loop.
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the background event loop without waiting.
         
         Args:
             coro: Async coroutine to execute
             
         Returns:
-            Result from the coroutine
+            Future that resolves to the coroutine result
         """
         if self._loop is None or not self._loop.is_running():
             self._start_loop()
         
-        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-        return future.result()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    def run_async(self, coro: Coroutine) -> Any:
+        """Execute a coroutine in the background event loop.
+        
+        Args:
+            coro: Async coroutine to execute
+            
+        Returns:
+            Result from the coroutine
+        """
+        return self.submit(coro).result()
     
     def _cleanup(self):
         """Clean up the event loop on shutdown."""
@@ -92,33 +107,64 @@ def run_async(coro: Coroutine) -> Any:
     return _executor.run_async(coro)
 
 
-def async_cached(ttl: int = 300):
+def submit_async(coro: Coroutine) -> Future:
+    """Schedule a coroutine on the persistent event loop and return immediately.
+    
+    Useful for fire-and-forget background work such as warming connection
+    pools, where the caller must not block the Streamlit script.
+    
+    Args:
+        coro: Async coroutine to execute
+        
+    Returns:
+        concurrent.futures.Future for the coroutine result
+    """
+    return _executor.submit(coro)
+
+
+def async_cached(ttl: int = 300, maxsize: int = 256):
     """Decorator to cache async function results.
     
+    Entries are keyed on the full call signature and evicted in LRU
+    order once ``maxsize`` is exceeded.
+    
     Args:
         ttl: Time to live in seconds
+        maxsize: Maximum number of cached entries
     """
     def decorator(func):
-        cache = {}
+        cache = OrderedDict()
         cache_time = {}
+        counters = {"hits": 0, "misses": 0}
         
         @wraps(func)
         def wrapper(*args, **kwargs):
-            import time
-            key = str(args) + str(kwargs)
+            key = _make_key(args, kwargs, typed=False)
             current_time = time.time()
             
             # Check cache first
             if key in cache and (current_time - cache_time[key]) < ttl:
+                cache.move_to_end(key)
+                counters["hits"] += 1
                 return cache[key]
             
             # Call the async function and cache result
+            counters["misses"] += 1
             result = run_async(func(*args, **kwargs))
             cache[key] = result
             cache_time[key] = current_time
+            cache.move_to_end(key)
+            if len(cache) > maxsize:
+                evicted, _ = cache.popitem(last=False)
+                cache_time.pop(evicted, None)
             return result
         
-        # Add cache clearing method
-        wrapper.clear_cache = lambda: cache.clear()
+        def clear_cache():
+            cache.clear()
+            cache_time.clear()
+        
+        # Add cache clearing and observability methods
+        wrapper.clear_cache = clear_cache
+        wrapper.stats = lambda: {"size": len(cache), **counters}
         return wrapper
     return decorator
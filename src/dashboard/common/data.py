@@ -1,14 +1,23 @@
 """Common data utilities for dashboard."""
 import os
-import pandas as pd
 import asyncio
+import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
 import streamlit as st
 from dotenv import load_dotenv
 
+from .async_helper import run_async, submit_async
+
 load_dotenv()
 
+# Number of pooled connections kept open by the dashboard engine.
+POOL_SIZE = 5
+# asyncpg/SQLAlchemy prepared statement cache size per connection.
+STATEMENT_CACHE_SIZE = 2048
+
+_ENGINE = None
+
 
 def get_db_url():
     """Return the database URL used by the dashboard."""
@@ -16,22 +25,50 @@ def get_db_url():
     return os.getenv("DATABASE_URL", default)
 
 
+def _get_engine():
+    """Return the process-wide async engine, creating it on first use.
+
+    The engine (and its connection pool) lives on the persistent background
+    event loop from ``async_helper`` so connections survive across reruns.
+    """
+    global _ENGINE
+    if _ENGINE is None:
+        url = get_db_url()
+        connect_args = {}
+        if url.startswith("postgresql+asyncpg"):
+            # JIT only adds per-query planning latency for the dashboard's short
+            # aggregates; a larger statement cache keeps the hot SQL prepared.
+            connect_args = {
+                "server_settings": {"jit": "off", "application_name": "globalid-dashboard"},
+                "statement_cache_size": STATEMENT_CACHE_SIZE,
+                "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+            }
+        _ENGINE = create_async_engine(url, pool_size=POOL_SIZE, pool_pre_ping=True,
+                                      connect_args=connect_args)
+    return _ENGINE
+
+
 async def _fetch(query: str):
     """Asynchronously execute a SQL query and return a pandas DataFrame."""
-    engine = create_async_engine(get_db_url())
-    try:
-        async with engine.connect() as conn:
-            result = await conn.execute(text(query))
-            df = pd.DataFrame(result.fetchall(), columns=result.keys())
-    finally:
-        await engine.dispose()
+    async with _get_engine().connect() as conn:
+        result = await conn.execute(text(query))
+        df = pd.DataFrame(result.fetchall(), columns=result.keys())
     return df
 
 
+async def _warmup(n: int = POOL_SIZE):
+    """Open ``n`` pooled connections concurrently so the first query hits a warm pool."""
+    async def _ping():
+        async with _get_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*[_ping() for _ in range(n)])
+
+
 @st.cache_data(ttl=300, show_spinner=False)
 def _cached_run(query: str):
     """Run the async query in a synchronous context and cache results."""
-    return asyncio.run(_fetch(query))
+    return run_async(_fetch(query))
 
 
 def run_query(query: str) -> pd.DataFrame:
@@ -41,3 +78,12 @@ def run_query(query: str) -> pd.DataFrame:
     except Exception as e:
         st.error(f"Database Error: {e}")
         return pd.DataFrame()
+
+
+# Prewarm the pool in the background at startup; never block or fail the import
+# when the database is unavailable.
+if os.getenv("DASHBOARD_PREWARM") == "1":
+    try:
+        submit_async(_warmup())
+    except Exception:
+        pass
@@ -16,6 +16,15 @@ def render_sidebar(t, country_list: list, c_df: pd.DataFrame, country_error: Opt
     Returns:
         tuple: (page, nav_labels, sel_country, sel_country_id)
     """
+    # Build the name -> id lookup once per country list instead of scanning
+    # the DataFrame on every rerun.
+    if "name_to_id" not in st.session_state or st.session_state.get("name_to_id_sig") != len(c_df):
+        if c_df.empty:
+            st.session_state["name_to_id"] = {}
+        else:
+            st.session_state["name_to_id"] = dict(zip(c_df["name"], c_df["id"].astype(int)))
+        st.session_state["name_to_id_sig"] = len(c_df)
+
     with st.sidebar:
         st.markdown(
             f"<div class=\"brand\">🌍 <span class=\"title\">{t('app_title')}</span><div class=\"subtitle\">{t('platform_desc')}</div></div>",
@@ -35,7 +44,7 @@ def render_sidebar(t, country_list: list, c_df: pd.DataFrame, country_error: Opt
                     default_index = country_list.index(prev)
                 sel = st.selectbox(t("select_country"), country_list, index=default_index, key="country_select")
                 st.session_state["sel_country"] = sel
-                sel_country_id = int(c_df.loc[c_df["name"] == sel, "id"].iloc[0])
+                sel_country_id = int(st.session_state["name_to_id"][sel])
                 sel_country = sel
             else:
                 sel_country = None
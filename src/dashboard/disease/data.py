@@ -3,9 +3,13 @@ import streamlit as st
 from src.dashboard.common.data import run_query
 
 
-def get_disease_list(country_id: int):
+@st.cache_data(ttl=300, show_spinner=False)
+def get_disease_list(country_id: int, lang: str = "en"):
     """Return disease display names and a mapping for a country.
 
+    ``lang`` is passed explicitly (rather than read from session state) so it
+    is part of the cache key.
+
     Returns:
         tuple: (display_list, name_to_code) where `display_list` is a list of names
                suitable for `selectbox` and `name_to_code` maps the display name
@@ -23,7 +27,6 @@ def get_disease_list(country_id: int):
     if df.empty:
         return [], {}
 
-    lang = st.session_state.get("lang", "en")
     if lang == "zh":
         df['display_name'] = df['standard_name_zh'].fillna(df['name_en'])
     else:
@@ -1,24 +1,31 @@
 """Disease visualization plots."""
 import streamlit as st
-import plotly.express as px
+import pandas as pd
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+
+@st.cache_data(show_spinner=False)
+def _to_csv(frame_hash: int, _frame) -> bytes:
+    """Serialize a DataFrame to CSV bytes, cached by its content hash."""
+    return _frame.to_csv(index=False).encode()
 
 
 def plot_top_diseases(df, t):
-    """Render bar chart for top diseases by cases and deaths."""
-    col1, col2 = st.columns(2)
-    with col1:
-        fig = px.bar(df, x='name', y='total_cases',
-                     labels={'name': t('disease_label'), 'total_cases': t('cases')},
-                     template='plotly_white')
-        fig.update_layout(height=350, xaxis_tickangle=-45)
-        st.plotly_chart(fig, width='stretch')
-    with col2:
-        fig = px.bar(df, x='name', y='total_deaths',
-                     labels={'name': t('disease_label'), 'total_deaths': t('deaths')},
-                     template='plotly_white', color_discrete_sequence=['#EF553B'])
-        fig.update_layout(height=350, xaxis_tickangle=-45)
-        st.plotly_chart(fig, width='stretch')
+    """Render bar charts for top diseases by cases and deaths.
+
+    Both panels share one figure so a rerun ships a single JSON payload, and
+    ``uirevision`` keeps zoom/pan state while Plotly diffs the traces.
+    """
+    fig = make_subplots(rows=1, cols=2, subplot_titles=(t('cases'), t('deaths')))
+    fig.add_trace(go.Bar(x=df['name'], y=df['total_cases'], name=t('cases'),
+                         marker_color='#636EFA'), row=1, col=1)
+    fig.add_trace(go.Bar(x=df['name'], y=df['total_deaths'], name=t('deaths'),
+                         marker_color='#EF553B'), row=1, col=2)
+    fig.update_xaxes(title_text=t('disease_label'), tickangle=-45)
+    fig.update_layout(height=350, template='plotly_white', showlegend=False,
+                      uirevision='top_diseases')
+    st.plotly_chart(fig, width='stretch')
 
 
 def plot_trend_chart(df, t, df_display):
@@ -41,6 +48,6 @@ def plot_trend_chart(df, t, df_display):
     
     with st.expander(t('raw_data'), expanded=False):
         st.dataframe(df_display, width='stretch')
-        csv = df.to_csv(index=False)
+        csv = _to_csv(int(pd.util.hash_pandas_object(df, index=False).sum()), df)
         st.download_button(t('download_csv'), data=csv, 
                           file_name='trend_data.csv', key='trend_download')
@@ -1,200 +1,385 @@
 """Enhanced task management UI with advanced features."""
+import asyncio
 import streamlit as st
 import pandas as pd
 import json
 import os
 from typing import List, Optional
 from datetime import datetime
+from types import SimpleNamespace
 
+from sqlalchemy import select, desc
+
+from src.core.database import get_db
 from src.core.task_manager import task_manager
 from src.domain import TaskStatus, TaskType, TaskPriority, Task
-from .async_helper import run_async
+from src.dashboard.common.async_helper import run_async
 
 # Categories storage path
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
 CATEGORIES_PATH = os.path.join(ROOT, "data", "task_categories.json")
 
+# In-memory copy of the categories file, loaded on first access
+_categories_cache: Optional[List[str]] = None
+
+# Rows per page in task tables
+TASK_PAGE_SIZE = 25
+DATETIME_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Display lookups, built once instead of formatting enums per task per rerun.
+# TaskStatus/TaskType/TaskPriority are str enums, so raw values hash to the
+# same keys as the members.
+_STATUS_NAME = {s: s.name.lower() for s in TaskStatus}
+_TYPE_NAME = {tt: tt.name for tt in TaskType}
+_PRIORITY_NAME = {p: p.name for p in TaskPriority}
+_STATUS_BADGE = {
+    TaskStatus.PENDING: "🟡",
+    TaskStatus.RUNNING: "🔵",
+    TaskStatus.COMPLETED: "🟢",
+    TaskStatus.FAILED: "🔴",
+    TaskStatus.CANCELLED: "⚫",
+}
+# Task types listed in the AI Tasks tab
+_AI_TASK_TYPES = frozenset(
+    tt for tt in TaskType if "generate" in tt.name.lower() or "review" in tt.name.lower()
+)
+# Quick actions offered by the task pane, built for every status so none is left without actions
+_ALLOWED_ACTIONS = {
+    status: frozenset(
+        action for action, allowed in (
+            ("start", status != TaskStatus.RUNNING),
+            ("pause", status == TaskStatus.RUNNING),
+            ("complete", status not in (TaskStatus.COMPLETED, TaskStatus.CANCELLED)),
+            ("cancel", status != TaskStatus.CANCELLED),
+        ) if allowed
+    )
+    for status in TaskStatus
+}
+# (action, button label, target status, success message) in display order
+_PANE_ACTIONS = (
+    ("start", "▶️ Start", TaskStatus.RUNNING, "Started"),
+    ("pause", "⏸️ Pause", TaskStatus.PENDING, "Paused"),
+    ("complete", "✅ Complete", TaskStatus.COMPLETED, "Completed"),
+    ("cancel", "❌ Cancel", TaskStatus.CANCELLED, "Cancelled"),
+)
+_ENTRY_ICON = {"info": "ℹ️", "success": "✅", "error": "❌", "warning": "⚠️"}
+
 
 def _load_categories() -> List[str]:
-    """Load task categories from JSON file."""
-    try:
-        if os.path.exists(CATEGORIES_PATH):
-            with open(CATEGORIES_PATH, "r", encoding="utf-8") as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return ["ai", "crawler", "data_processing"]
+    """Load task categories, reading the JSON file at most once per process."""
+    global _categories_cache
+    if _categories_cache is None:
+        categories = ["ai", "crawler", "data_processing"]
+        try:
+            if os.path.exists(CATEGORIES_PATH):
+                with open(CATEGORIES_PATH, "r", encoding="utf-8") as f:
+                    categories = json.load(f)
+        except Exception:
+            pass
+        _categories_cache = categories
+    return list(_categories_cache)
 
 
 def _save_categories(categories: List[str]):
-    """Save task categories to JSON file."""
+    """Save task categories to JSON file.
+    
+    Writes to a temporary file and renames it over the target, so a crash
+    mid-write never leaves a truncated JSON file behind.
+    """
+    global _categories_cache
+    _categories_cache = list(categories)
     os.makedirs(os.path.dirname(CATEGORIES_PATH), exist_ok=True)
-    with open(CATEGORIES_PATH, "w", encoding="utf-8") as f:
+    tmp_path = CATEGORIES_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(categories, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, CATEGORIES_PATH)
+
+
+def _snapshot(obj) -> SimpleNamespace:
+    """Copy an ORM row's column values into a plain, picklable namespace.
+
+    ``st.cache_data`` pickles return values; detached ORM instances do not
+    round-trip reliably, but attribute access (``task.status`` etc.) is kept.
+    """
+    return SimpleNamespace(**{attr.key: getattr(obj, attr.key) for attr in obj.__mapper__.column_attrs})
+
 
+async def _get_all_crawl_tasks(limit: int = 100):
+    """Fetch recent crawl tasks of any status, newest first."""
+    async with get_db() as db:
+        query = (
+            select(Task)
+            .where(Task.task_type == TaskType.CRAWL_DATA)
+            .order_by(desc(Task.created_at))
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        return result.scalars().all()
 
-def _render_task_table_with_actions(t, tasks: list, show_actions: bool = True):
-    """Render task table with expandable details in each row.
+
+async def _fetch_task_overview() -> tuple:
+    """Run all task-center list queries concurrently on their own sessions."""
+    return await asyncio.gather(
+        task_manager.get_task_statistics(),
+        task_manager.get_pending_tasks(limit=100),
+        task_manager.get_running_tasks(),
+        task_manager.get_pending_tasks(limit=200, task_types=sorted(_AI_TASK_TYPES)),
+        _get_all_crawl_tasks(),
+    )
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_task_overview() -> dict:
+    """Statistics and task lists for every tab, fetched in one overlapped
+    round-trip and cached briefly. Tasks are returned as snapshots."""
+    stats, pending, running, ai_tasks, crawl = run_async(_fetch_task_overview())
+    return {
+        "stats": stats,
+        "pending": [_snapshot(task) for task in pending],
+        "running": [_snapshot(task) for task in running],
+        "ai": [_snapshot(task) for task in ai_tasks],
+        "crawl": [_snapshot(task) for task in crawl],
+    }
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_workbook(task_uuid: str, status: str) -> list:
+    """Workbook entries for one task; ``status`` is part of the key so a
+    status change refreshes the log."""
+    return [_snapshot(entry) for entry in run_async(task_manager.get_task_workbook(task_uuid))]
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _cached_workbooks(task_uuids: tuple) -> dict:
+    """Workbook entries for many tasks, fetched in a single query."""
+    workbooks = run_async(task_manager.get_workbooks_for_tasks(list(task_uuids)))
+    return {uuid: [_snapshot(entry) for entry in entries] for uuid, entries in workbooks.items()}
+
+
+def _clear_task_caches():
+    """Invalidate cached task queries after a mutation."""
+    _cached_task_overview.clear()
+    _cached_workbooks.clear()
+
+
+def _update_task_status(task_uuid: str, status: TaskStatus):
+    """Update a task's status and invalidate cached task queries.
+    
+    The updated task is kept in session state so a fragment rerun of its
+    row renders the new status without reloading the whole task list.
+    """
+    task = run_async(task_manager.update_task_status(task_uuid, status))
+    _clear_task_caches()
+    if task is not None:
+        st.session_state[f"task_state_{task_uuid}"] = _snapshot(task)
+
+
+def _enum_name(value, names: dict) -> str:
+    """Display name for a task enum value via its lookup table; "N/A" if unset."""
+    if value is None:
+        return "N/A"
+    return names.get(value, str(value))
+
+
+def _format_dt(value: Optional[datetime], fmt: str = DATETIME_FMT) -> str:
+    """Format an optional datetime, returning "N/A" when unset."""
+    return value.strftime(fmt) if value else "N/A"
+
+
+def _format_task_times(task, fmt: str = DATETIME_FMT) -> tuple:
+    """Format a task's created/started/completed times once for reuse."""
+    return _format_dt(task.created_at, fmt), _format_dt(task.started_at, fmt), _format_dt(task.completed_at, fmt)
+
+
+def _task_duration(task) -> str:
+    """Human-readable duration for a finished or running task."""
+    if task.actual_duration:
+        return f"{task.actual_duration}s"
+    if task.started_at and not task.completed_at:
+        return f"{int((datetime.now() - task.started_at).total_seconds())}s (running)"
+    return "N/A"
+
+
+def _format_workbook_entry(entry) -> str:
+    """Format one workbook entry as a log block: header, indented content, blank line."""
+    header = f"{entry.created_at.strftime('%H:%M:%S')} {_ENTRY_ICON.get(entry.entry_type, '📝')} {entry.title}"
+    if entry.content:
+        body = "\n".join(f"  {line}" for line in entry.content.split("\n"))
+        return f"{header}\n{body}\n"
+    return f"{header}\n"
+
+
+def _render_task_table_with_actions(t, tasks: list, show_actions: bool = True,
+                                    workbooks: Optional[dict] = None, key: str = "tasks"):
+    """Render tasks as one paginated, selectable table plus a detail pane.
+    
+    A single dataframe widget replaces the per-task expanders; details,
+    log and actions are rendered only for the selected task.
     
     Args:
         t: Translation function
         tasks: List of task objects
         show_actions: Whether to show action buttons (deprecated)
+        workbooks: Optional prefetched mapping of task UUID to workbook
+            entries; tasks missing from it are fetched on demand
+        key: Widget key prefix, unique per table on the page
     """
     if not tasks:
         st.info(t("no_tasks"))
         return
     
-    # Display tasks in expandable containers
-    for i, task in enumerate(tasks):
-        # Create status badge
-        status_map = {
-            "pending": "🟡",
-            "running": "🔵",
-            "completed": "🟢",
-            "failed": "🔴",
-            "cancelled": "⚫"
-        }
-        status_str = str(task.status).replace("TaskStatus.", "").lower()
-        status_badge = status_map.get(status_str, "⚪")
-        
-        # Calculate duration
-        duration = "N/A"
-        if task.actual_duration:
-            duration = f"{task.actual_duration}s"
-        elif task.started_at and not task.completed_at:
-            duration = f"{int((datetime.now() - task.started_at).total_seconds())}s (running)"
-        
-        # Create expander with key info in title
-        with st.expander(
-            f"{status_badge} **{task.task_name}** | {str(task.task_type).replace('TaskType.', '')} | {task.progress}%",
-            expanded=False
-        ):
-            # Basic info in columns
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown("**UUID**")
-                st.code(task.task_uuid, language=None)
-                st.markdown("**Status**")
-                st.text(str(task.status).replace("TaskStatus.", ""))
-            
-            with col2:
-                st.markdown("**Priority**")
-                st.text(str(task.priority).replace("TaskPriority.", ""))
-                st.markdown("**Progress**")
-                st.text(f"{task.progress}%")
-            
-            with col3:
-                st.markdown("**Created**")
-                st.text(task.created_at.strftime("%Y-%m-%d %H:%M:%S") if task.created_at else "N/A")
-                st.markdown("**Started**")
-                st.text(task.started_at.strftime("%Y-%m-%d %H:%M:%S") if task.started_at else "N/A")
-            
-            with col4:
-                st.markdown("**Completed**")
-                st.text(task.completed_at.strftime("%Y-%m-%d %H:%M:%S") if task.completed_at else "N/A")
-                st.markdown("**Duration**")
-                st.text(duration)
+    # Fresh list data supersedes any state the pane recorded after an action
+    for task in tasks:
+        st.session_state.pop(f"task_state_{task.task_uuid}", None)
+    
+    # Pagination
+    page_count = (len(tasks) - 1) // TASK_PAGE_SIZE + 1
+    page = 1
+    if page_count > 1:
+        page = int(st.number_input(
+            f"Page (1-{page_count})", min_value=1, max_value=page_count, value=1, step=1,
+            key=f"{key}_page"
+        ))
+    page_tasks = tasks[(page - 1) * TASK_PAGE_SIZE:page * TASK_PAGE_SIZE]
+    
+    rows = []
+    for task in page_tasks:
+        status_str = _enum_name(task.status, _STATUS_NAME)
+        rows.append({
+            "Status": f"{_STATUS_BADGE.get(task.status, '⚪')} {status_str}",
+            "Name": task.task_name,
+            "Type": _enum_name(task.task_type, _TYPE_NAME),
+            "Progress": task.progress,
+            "Created": _format_dt(task.created_at),
+            "Duration": _task_duration(task),
+        })
+    
+    event = st.dataframe(
+        pd.DataFrame(rows),
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=f"{key}_table",
+        column_config={
+            "Progress": st.column_config.ProgressColumn(min_value=0, max_value=100, format="%d%%"),
+        },
+    )
+    
+    selected = event.selection.rows
+    if selected and selected[0] < len(page_tasks):
+        _render_task_pane(t, page_tasks[selected[0]], workbooks, key)
+    else:
+        st.caption("Select a task to view details and actions")
+
+
+@st.fragment
+def _render_task_pane(t, task, workbooks: Optional[dict] = None, key: str = "tasks"):
+    """Render details, log and action buttons for the selected task.
+    
+    Args:
+        t: Translation function
+        task: Task object (or snapshot) to render
+        workbooks: Optional prefetched mapping of task UUID to workbook entries
+        key: Widget key prefix of the owning table
+    """
+    # Fragment reruns replay the original arguments, so pick up the state
+    # written by this pane's own actions.
+    task = st.session_state.get(f"task_state_{task.task_uuid}", task)
+    created_str, started_str, completed_str = _format_task_times(task)
+    
+    with st.container(border=True):
+        st.markdown(f"**{task.task_name}**")
+        
+        # Basic info in columns
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown("**UUID**")
+            st.code(task.task_uuid, language=None)
+            st.markdown("**Status**")
+            st.text(_enum_name(task.status, _STATUS_NAME))
+        
+        with col2:
+            st.markdown("**Priority**")
+            st.text(_enum_name(task.priority, _PRIORITY_NAME))
+            st.markdown("**Progress**")
+            st.text(f"{task.progress}%")
+        
+        with col3:
+            st.markdown("**Created**")
+            st.text(created_str)
+            st.markdown("**Started**")
+            st.text(started_str)
+        
+        with col4:
+            st.markdown("**Completed**")
+            st.text(completed_str)
+            st.markdown("**Duration**")
+            st.text(_task_duration(task))
+        
+        # Description
+        if task.description:
+            st.markdown("**Description**")
+            st.info(task.description)
+        
+        # Input/Output Data
+        if task.input_data or task.output_data:
+            data_col1, data_col2 = st.columns(2)
             
-            # Description
-            if task.description:
-                st.markdown("**Description**")
-                st.info(task.description)
+            with data_col1:
+                if task.input_data:
+                    st.markdown("**Input Data**")
+                    st.json(task.input_data, expanded=False)
             
-            # Input/Output Data
-            if task.input_data or task.output_data:
-                data_col1, data_col2 = st.columns(2)
-                
-                with data_col1:
-                    if task.input_data:
-                        st.markdown("**Input Data**")
-                        st.json(task.input_data, expanded=False)
+            with data_col2:
+                if task.output_data:
+                    st.markdown("**Output Data**")
+                    st.json(task.output_data, expanded=False)
+        
+        # Last Error
+        if task.last_error:
+            st.markdown("**Last Error**")
+            st.error(task.last_error)
+        
+        # Workbook Logs
+        try:
+            if workbooks is not None and task.task_uuid in workbooks:
+                workbook = workbooks[task.task_uuid]
+            else:
+                workbook = _cached_workbook(task.task_uuid, _enum_name(task.status, _STATUS_NAME))
+            if workbook:
+                st.markdown("**📔 Execution Log**")
                 
-                with data_col2:
-                    if task.output_data:
-                        st.markdown("**Output Data**")
-                        st.json(task.output_data, expanded=False)
-            
-            # Last Error
-            if task.last_error:
-                st.markdown("**Last Error**")
-                st.error(task.last_error)
-            
-            # Workbook Logs
-            try:
-                workbook = run_async(task_manager.get_task_workbook(task.task_uuid))
-                if workbook:
-                    st.markdown("**📔 Execution Log**")
-                    
-                    # Build log text
-                    log_lines = []
-                    for entry in workbook:
-                        entry_time = entry.created_at.strftime("%H:%M:%S")
-                        entry_icon = {"info": "ℹ️", "success": "✅", "error": "❌", "warning": "⚠️"}.get(entry.entry_type, "📝")
-                        log_lines.append(f"{entry_time} {entry_icon} {entry.title}")
-                        if entry.content:
-                            # Indent content
-                            for line in entry.content.split('\n'):
-                                log_lines.append(f"  {line}")
-                        log_lines.append("")  # Empty line separator
-                    
-                    # Display in scrollable text area
-                    log_text = "\n".join(log_lines)
-                    st.text_area(
-                        "Log Details",
-                        value=log_text,
-                        height=200,
-                        disabled=True,
-                        label_visibility="collapsed",
-                        key=f"log_{task.task_uuid}_{i}"
-                    )
-            except Exception as e:
-                pass  # Silently skip if workbook unavailable
-            
-            # Quick Actions
-            st.markdown("**Actions**")
-            action_cols = st.columns(4)
-            
-            with action_cols[0]:
-                if task.status != TaskStatus.RUNNING:
-                    if st.button("▶️ Start", key=f"start_{task.task_uuid}_{i}", type="primary", use_container_width=True):
-                        try:
-                            run_async(task_manager.update_task_status(task.task_uuid, TaskStatus.RUNNING))
-                            st.success("Started")
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed: {e}")
-            
-            with action_cols[1]:
-                if task.status == TaskStatus.RUNNING:
-                    if st.button("⏸️ Pause", key=f"pause_{task.task_uuid}_{i}", use_container_width=True):
-                        try:
-                            run_async(task_manager.update_task_status(task.task_uuid, TaskStatus.PENDING))
-                            st.success("Paused")
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed: {e}")
-            
-            with action_cols[2]:
-                if task.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]:
-                    if st.button("✅ Complete", key=f"complete_{task.task_uuid}_{i}", use_container_width=True):
-                        try:
-                            run_async(task_manager.update_task_status(task.task_uuid, TaskStatus.COMPLETED))
-                            st.success("Completed")
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed: {e}")
-            
-            with action_cols[3]:
-                if task.status not in [TaskStatus.CANCELLED]:
-                    if st.button("❌ Cancel", key=f"cancel_{task.task_uuid}_{i}", use_container_width=True):
-                        try:
-                            run_async(task_manager.update_task_status(task.task_uuid, TaskStatus.CANCELLED))
-                            st.success("Cancelled")
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed: {e}")
+                # Display in scrollable text area
+                log_text = "\n".join(_format_workbook_entry(entry) for entry in workbook)
+                st.text_area(
+                    "Log Details",
+                    value=log_text,
+                    height=200,
+                    disabled=True,
+                    label_visibility="collapsed",
+                    key=f"{key}_log_{task.task_uuid}"
+                )
+        except Exception as e:
+            pass  # Silently skip if workbook unavailable
+        
+        # Quick Actions
+        st.markdown("**Actions**")
+        actions = _ALLOWED_ACTIONS[TaskStatus(task.status)]
+        
+        # One horizontal container instead of a 4-column grid
+        with st.container(horizontal=True):
+            for action, label, new_status, done_msg in _PANE_ACTIONS:
+                if action not in actions:
+                    continue
+                if st.button(label, key=f"{key}_{action}_{task.task_uuid}",
+                             type="primary" if action == "start" else "secondary"):
+                    try:
+                        _update_task_status(task.task_uuid, new_status)
+                        st.success(done_msg)
+                        st.rerun(scope="fragment")
+                    except Exception as e:
+                        st.error(f"Failed: {e}")
 
 
 def _render_task_detail(t, task_uuid: str):
@@ -221,21 +406,22 @@ def _render_task_detail(t, task_uuid: str):
         
         # Task info
         st.markdown(f"**UUID:** `{task.task_uuid}`")
-        st.markdown(f"**Status:** {task.status} | **Priority:** {task.priority} | **Progress:** {task.progress}%")
+        st.markdown(f"**Status:** {_enum_name(task.status, _STATUS_NAME)} | **Priority:** {_enum_name(task.priority, _PRIORITY_NAME)} | **Progress:** {task.progress}%")
         
         # Tabs for different sections
         tabs = st.tabs([t("basic_info"), t("input_data"), t("workbook"), t("actions")])
         
         # Basic Info tab
         with tabs[0]:
+            created_str, started_str, completed_str = _format_task_times(task, "%Y-%m-%d %H:%M")
             col1, col2 = st.columns(2)
             with col1:
-                st.metric(t("task_type"), str(task.task_type))
-                st.metric(t("created_at"), task.created_at.strftime("%Y-%m-%d %H:%M") if task.created_at else "N/A")
-                st.metric(t("started_at"), task.started_at.strftime("%Y-%m-%d %H:%M") if task.started_at else "N/A")
+                st.metric(t("task_type"), _enum_name(task.task_type, _TYPE_NAME))
+                st.metric(t("created_at"), created_str)
+                st.metric(t("started_at"), started_str)
             with col2:
-                st.metric(t("priority"), str(task.priority))
-                st.metric(t("completed_at"), task.completed_at.strftime("%Y-%m-%d %H:%M") if task.completed_at else "N/A")
+                st.metric(t("priority"), _enum_name(task.priority, _PRIORITY_NAME))
+                st.metric(t("completed_at"), completed_str)
                 st.metric(t("duration"), f"{task.actual_duration}s" if task.actual_duration else "N/A")
             
             if task.description:
@@ -305,7 +491,7 @@ def _render_task_detail(t, task_uuid: str):
             with col1:
                 if st.button("▶️ " + t("start_task"), key="detail_start", type="primary"):
                     try:
-                        run_async(task_manager.update_task_status(task_uuid, TaskStatus.RUNNING))
+                        _update_task_status(task_uuid, TaskStatus.RUNNING)
                         st.success(t("task_action_success"))
                         st.rerun()
                     except Exception as e:
@@ -314,7 +500,7 @@ def _render_task_detail(t, task_uuid: str):
             with col2:
                 if st.button("✅ " + t("complete_task"), key="detail_complete"):
                     try:
-                        run_async(task_manager.update_task_status(task_uuid, TaskStatus.COMPLETED))
+                        _update_task_status(task_uuid, TaskStatus.COMPLETED)
                         st.success(t("task_action_success"))
                         st.rerun()
                     except Exception as e:
@@ -323,7 +509,7 @@ def _render_task_detail(t, task_uuid: str):
             with col3:
                 if st.button("❌ " + t("cancel_task"), key="detail_cancel"):
                     try:
-                        run_async(task_manager.update_task_status(task_uuid, TaskStatus.CANCELLED))
+                        _update_task_status(task_uuid, TaskStatus.CANCELLED)
                         st.success(t("task_action_success"))
                         st.rerun()
                     except Exception as e:
@@ -339,8 +525,11 @@ def _render_queue_view(t):
     
     try:
         # Get tasks by status
-        pending = run_async(task_manager.get_pending_tasks(limit=100))
-        running = run_async(task_manager.get_running_tasks())
+        overview = _cached_task_overview()
+        pending, running = overview["pending"], overview["running"]
+        
+        # Prefetch all workbooks for the queue in one round-trip
+        workbooks = _cached_workbooks(tuple(task.task_uuid for task in pending + running))
         
         # Display counts
         col1, col2, col3 = st.columns(3)
@@ -354,7 +543,7 @@ def _render_queue_view(t):
         # Pending queue
         st.markdown(f"### ⏳ {t('pending_tasks')} ({len(pending)})")
         if pending:
-            _render_task_table_with_actions(t, pending, show_actions=True)
+            _render_task_table_with_actions(t, pending, show_actions=True, workbooks=workbooks, key="queue_pending")
         else:
             st.info(t("no_pending_tasks"))
         
@@ -363,7 +552,7 @@ def _render_queue_view(t):
         # Running queue
         st.markdown(f"### ▶️ {t('running_tasks')} ({len(running)})")
         if running:
-            _render_task_table_with_actions(t, running, show_actions=True)
+            _render_task_table_with_actions(t, running, show_actions=True, workbooks=workbooks, key="queue_running")
         else:
             st.info(t("no_running_tasks"))
     
@@ -400,7 +589,7 @@ def render_task_center(t, sel_country_id: Optional[int]):
         
         try:
             # Use async wrapper to avoid event loop issues
-            stats = run_async(task_manager.get_task_statistics())
+            stats = _cached_task_overview()["stats"]
             if stats is None:
                 stats = {"total": 0, "by_status": {}, "by_type": {}}
         except Exception as e:
@@ -438,12 +627,8 @@ def render_task_center(t, sel_country_id: Optional[int]):
     with tabs[2]:
         st.subheader(t("ai_tasks"))
         try:
-            ai_tasks = run_async(task_manager.get_pending_tasks(limit=200))
-            ai_tasks = [
-                task for task in ai_tasks
-                if 'generate' in str(task.task_type).lower() or 'review' in str(task.task_type).lower()
-            ]
-            _render_task_table_with_actions(t, ai_tasks)
+            ai_tasks = _cached_task_overview()["ai"]
+            _render_task_table_with_actions(t, ai_tasks, key="ai")
         except Exception as e:
             st.error(f"{t('connection_failed')}: {e}")
     
@@ -452,26 +637,11 @@ def render_task_center(t, sel_country_id: Optional[int]):
         st.subheader(t("crawler_tasks"))
         try:
             # 获取所有爬虫任务（不只是pending）
-            from src.domain import TaskType
-            from sqlalchemy import select, or_, desc
-            from src.core.database import get_db
-            
-            async def get_all_crawl_tasks():
-                async with get_db() as db:
-                    query = (
-                        select(Task)
-                        .where(Task.task_type == TaskType.CRAWL_DATA)
-                        .order_by(desc(Task.created_at))
-                        .limit(100)
-                    )
-                    result = await db.execute(query)
-                    return result.scalars().all()
-            
-            crawlers = run_async(get_all_crawl_tasks())
+            crawlers = _cached_task_overview()["crawl"]
             
             if crawlers:
                 st.info(f"📊 Total {len(crawlers)} crawl task(s)")
-                _render_task_table_with_actions(t, crawlers)
+                _render_task_table_with_actions(t, crawlers, key="crawl")
             else:
                 st.info("No crawl tasks")
         except Exception as e:
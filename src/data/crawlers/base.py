@@ -3,11 +3,18 @@ GlobalID V2 Base Crawler
 
 基础爬虫类，定义通用的爬取接口和功能
 """
+import asyncio
+import io
+import json
+import sqlite3
+import threading
 import time
 from abc import ABC, abstractmethod
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -17,10 +24,22 @@ from src.core import get_config, get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; GlobalID/2.0)"
+DEFAULT_ACCEPT = "text/html,application/json;q=0.9,*/*;q=0.5"
+# 声明压缩编码，减少传输字节数；requests 会自动解压（br 需要安装 brotli）
+DEFAULT_ACCEPT_ENCODING = "gzip, br, deflate"
+# 条件请求缓存文件名（位于配置的 cache_dir 下，首次缓存响应时创建）
+HTTP_CACHE_FILE = "http_cache.sqlite"
+# 缓存条目的有效期（秒）和最大条目数，超出部分在写入时清理
+HTTP_CACHE_TTL = 7 * 24 * 3600
+HTTP_CACHE_MAX_ENTRIES = 500
+# 缓存的是解压后的内容，这些头部不再适用
+_UNCACHED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CrawlerResult:
-    """爬取结果数据类"""
+    """爬取结果数据类（不可变，使用 __slots__ 减少大批量结果的内存占用）"""
     
     title: str
     url: Optional[str] = None
@@ -32,15 +51,13 @@ class CrawlerResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
-        return {
-            "title": self.title,
-            "url": self.url,
-            "content": self.content,
-            "date": self.date.isoformat() if self.date else None,
-            "year_month": self.year_month,
-            "metadata": self.metadata,
-            "raw_data": self.raw_data,
-        }
+        data = {key: getattr(self, key) for key in _RESULT_FIELDS}
+        if self.date:
+            data["date"] = self.date.isoformat()
+        return data
+
+
+_RESULT_FIELDS = ("title", "url", "content", "date", "year_month", "metadata", "raw_data")
 
 
 class BaseCrawler(ABC):
@@ -56,6 +73,10 @@ class BaseCrawler(ABC):
         timeout: int = 30,
         max_retries: int = 3,
         delay: float = 1.0,
+        pool_connections: int = 20,
+        pool_maxsize: int = 50,
+        max_concurrency: int = 10,
+        http_cache: bool = False,
     ):
         """
         初始化爬虫
@@ -65,15 +86,32 @@ class BaseCrawler(ABC):
             timeout: 请求超时时间（秒）
             max_retries: 最大重试次数
             delay: 请求延迟（秒）
+            pool_connections: 连接池缓存的主机数
+            pool_maxsize: 每个主机保持的最大连接数（复用TCP/TLS连接）
+            max_concurrency: 异步请求的最大并发数
+            http_cache: 是否对GET请求启用条件请求缓存（ETag/Last-Modified，默认关闭）
         """
         self.config = get_config()
         self.timeout = timeout
         self.delay = delay
+        self.max_concurrency = max_concurrency
+        
+        # 按主机限速：记录每个主机下一个可用的请求时间
+        self._next_slot: Dict[str, float] = {}
+        self._slot_lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
+        
+        # 条件请求缓存：保存上次响应的校验器和内容，未变化时服务器返回304
+        self._cache_path = self.config.cache_dir / HTTP_CACHE_FILE if http_cache else None
         
         # 配置Session
         self.session = requests.Session()
         self.session.headers.update({
-            "User-Agent": user_agent or "Mozilla/5.0 (compatible; GlobalID/2.0)",
+            "User-Agent": user_agent or DEFAULT_USER_AGENT,
+            "Accept": DEFAULT_ACCEPT,
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+            "Connection": "keep-alive",
         })
         
         # 配置重试策略
@@ -83,33 +121,149 @@ class BaseCrawler(ABC):
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
         logger.info(f"{self.__class__.__name__} initialized")
     
-    def get(self, url: str, **kwargs) -> requests.Response:
+    def _reserve_slot(self, url: str) -> float:
         """
-        发送GET请求
+        为目标主机预约下一个请求时间槽（按主机限速）
         
         Args:
             url: 请求URL
-            **kwargs: 额外的请求参数
             
         Returns:
-            Response对象
+            发送请求前需要等待的秒数
+        """
+        host = urlsplit(url).netloc
+        with self._slot_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+        return slot - now
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """获取异步并发信号量（按事件循环惰性创建）"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """发送请求并检查状态码（不含限速）"""
+        if method == "GET" and self._cache_path and not kwargs.get("stream"):
+            return self._cached_get(url, **kwargs)
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            response.raise_for_status()
+            logger.debug(f"{method} {url} - Status: {response.status_code}")
+            return response
+        except requests.RequestException as e:
+            logger.error(f"{method} request failed for {url}: {e}")
+            raise
+    
+    def _cache_connect(self) -> sqlite3.Connection:
+        """打开条件请求缓存（不存在时创建文件和表）"""
+        conn = sqlite3.connect(self._cache_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, headers TEXT, body BLOB, stored_at REAL)"
+        )
+        return conn
+    
+    def _cache_lookup(self, key: str) -> Optional[tuple]:
+        """读取未过期的缓存条目；缓存文件尚未创建时不访问磁盘"""
+        if not self._cache_path.exists():
+            return None
+        with closing(self._cache_connect()) as conn, conn:
+            return conn.execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE url = ? AND stored_at >= ?",
+                (key, time.time() - HTTP_CACHE_TTL),
+            ).fetchone()
+    
+    def _cache_store(self, key: str, response: requests.Response):
+        """写入缓存条目，并清理过期条目和超出上限的最旧条目"""
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _UNCACHED_HEADERS}
+        now = time.time()
+        with closing(self._cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                 json.dumps(headers), response.content, now),
+            )
+            conn.execute("DELETE FROM responses WHERE stored_at < ?", (now - HTTP_CACHE_TTL,))
+            conn.execute(
+                "DELETE FROM responses WHERE url NOT IN "
+                "(SELECT url FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                (HTTP_CACHE_MAX_ENTRIES,),
+            )
+    
+    def _cache_touch(self, key: str):
+        """304 确认内容未变化，刷新条目的有效期"""
+        with closing(self._cache_connect()) as conn, conn:
+            conn.execute("UPDATE responses SET stored_at = ? WHERE url = ?", (time.time(), key))
+    
+    def _cached_get(self, url: str, **kwargs) -> requests.Response:
+        """
+        带条件请求的GET：携带上次的 ETag/Last-Modified，
+        服务器返回304时直接复用缓存的响应内容
         """
-        time.sleep(self.delay)
+        key = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+        row = self._cache_lookup(key)
+        
+        headers = dict(kwargs.pop("headers", None) or {})
+        if row:
+            etag, last_modified, _, _ = row
+            if etag:
+                headers.setdefault("If-None-Match", etag)
+            if last_modified:
+                headers.setdefault("If-Modified-Since", last_modified)
         
         try:
-            response = self.session.get(url, timeout=self.timeout, **kwargs)
+            response = self.session.get(url, timeout=self.timeout, headers=headers, **kwargs)
+            if response.status_code == 304 and row:
+                logger.debug(f"GET {url} - Not modified, using cached body")
+                self._cache_touch(key)
+                cached = requests.Response()
+                cached.status_code = 200
+                cached.url = response.url
+                cached.headers.update(json.loads(row[2]))
+                cached._content = row[3]
+                cached.encoding = response.encoding or requests.utils.get_encoding_from_headers(cached.headers)
+                cached.request = response.request
+                return cached
             response.raise_for_status()
             logger.debug(f"GET {url} - Status: {response.status_code}")
-            return response
         except requests.RequestException as e:
             logger.error(f"GET request failed for {url}: {e}")
             raise
+        
+        if "ETag" in response.headers or "Last-Modified" in response.headers:
+            self._cache_store(key, response)
+        return response
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        发送GET请求
+        
+        Args:
+            url: 请求URL
+            **kwargs: 额外的请求参数（传入 stream=True 时不预先读取响应体，
+                可配合 iter_json_items 或 response.raw 增量解析）
+            
+        Returns:
+            Response对象
+        """
+        time.sleep(self._reserve_slot(url))
+        return self._request("GET", url, **kwargs)
     
     def post(self, url: str, **kwargs) -> requests.Response:
         """
@@ -122,16 +276,81 @@ class BaseCrawler(ABC):
         Returns:
             Response对象
         """
-        time.sleep(self.delay)
+        time.sleep(self._reserve_slot(url))
+        return self._request("POST", url, **kwargs)
+    
+    def iter_json_items(self, response: requests.Response, prefix: str = "item") -> Iterator[Any]:
+        """
+        增量解析JSON响应中的数组元素
         
+        安装了 ijson 时逐个产出元素：以 ``stream=True`` 请求且响应体尚未读取时
+        直接从原始字节流解析，无需先把整个响应体读入内存；响应体已读取（默认的
+        非流式请求）时解析内存中的内容。未安装 ijson 时回退到 ``response.json()``。
+        
+        Args:
+            response: HTTP响应对象（建议以 stream=True 请求）
+            prefix: ijson 风格的路径前缀，如 "data.results.item"
+            
+        Yields:
+            数组中的每个元素
+        """
         try:
-            response = self.session.post(url, timeout=self.timeout, **kwargs)
-            response.raise_for_status()
-            logger.debug(f"POST {url} - Status: {response.status_code}")
-            return response
-        except requests.RequestException as e:
-            logger.error(f"POST request failed for {url}: {e}")
-            raise
+            import ijson
+        except ImportError:
+            ijson = None
+        
+        if ijson is not None:
+            if response._content is False:
+                # 流式响应且尚未读取：原始字节流仍可用
+                response.raw.decode_content = True
+                source = response.raw
+            else:
+                # 原始字节流已被读完，解析已读入内存的响应体
+                source = io.BytesIO(response.content)
+            yield from ijson.items(source, prefix)
+            return
+        
+        # 回退：整体解析后按路径遍历
+        nodes = [response.json()]
+        for key in prefix.split("."):
+            if key == "item":
+                nodes = [child for node in nodes if isinstance(node, list) for child in node]
+            else:
+                nodes = [node[key] for node in nodes if isinstance(node, dict) and key in node]
+        yield from nodes
+    
+    async def aget(self, url: str, **kwargs) -> requests.Response:
+        """
+        异步发送GET请求
+        
+        限速等待不阻塞事件循环，请求在线程池中执行，
+        因此不同主机的请求可以并发进行。
+        
+        Args:
+            url: 请求URL
+            **kwargs: 额外的请求参数
+            
+        Returns:
+            Response对象
+        """
+        await asyncio.sleep(self._reserve_slot(url))
+        async with self._get_semaphore():
+            return await asyncio.to_thread(self._request, "GET", url, **kwargs)
+    
+    async def apost(self, url: str, **kwargs) -> requests.Response:
+        """
+        异步发送POST请求
+        
+        Args:
+            url: 请求URL
+            **kwargs: 额外的请求参数
+            
+        Returns:
+            Response对象
+        """
+        await asyncio.sleep(self._reserve_slot(url))
+        async with self._get_semaphore():
+            return await asyncio.to_thread(self._request, "POST", url, **kwargs)
     
     @abstractmethod
     async def crawl(self, **kwargs) -> List[CrawlerResult]:
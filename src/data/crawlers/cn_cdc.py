@@ -8,13 +8,17 @@ GlobalID V2 China Infectious Disease Data Crawlers
 2. 提取年月信息并与数据库对比 - check_new_data()
 3. 只爬取新数据的详细内容（重量级）- crawl_details()
 """
+import asyncio
+import io
+import json
 import re
-from datetime import datetime
-from typing import List, Optional, Set, Dict
+from datetime import date, datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
-import xmltodict
-from bs4 import BeautifulSoup
+from lxml import etree
 from sqlalchemy import select, func
 
 from src.core import get_logger
@@ -24,6 +28,84 @@ from .base import BaseCrawler, CrawlerResult
 
 logger = get_logger(__name__)
 
+# orjson 为可选依赖，未安装时回退到标准库 json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 日期提取用的预编译正则（在解析循环中逐条调用）
+_RE_HTML_TAG = re.compile(r"<[^>]+>")
+_RE_NON_ALNUM = re.compile(r"[^a-zA-Z0-9\s]")
+_RE_MONTH_YEAR = re.compile(r"\b([A-Za-z]+)\s+(\d{4})\b")
+_RE_YEAR_MONTH = re.compile(r"\b(\d{4})\s+([A-Za-z]+)\b")
+_RE_CN_DATE = re.compile(r"(\d{4})年(\d{1,2})月")
+
+# 英文月份名（与 locale 无关），下标即月份
+_MONTH_NAMES = ("", "January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December")
+
+
+_MONTH_NUM = {name: i for i, name in enumerate(_MONTH_NAMES) if name}
+
+
+@lru_cache(maxsize=512)
+def _ym_to_date(year_month: str) -> datetime:
+    """
+    将 "2024 January" 解析为该月第一天
+    
+    直接查月份表，不经过 strptime 的 locale 处理；同一年月在多个数据源中反复出现，结果缓存
+    """
+    year, _, month = year_month.partition(" ")
+    if len(year) != 4 or not year.isdigit() or month not in _MONTH_NUM:
+        raise ValueError(f"无法解析年月: {year_month!r}")
+    return datetime(int(year), _MONTH_NUM[month], 1)
+
+
+# CDC Weekly 月度法定传染病报告的标题关键字
+NNID_TITLE = "National Notifiable Infectious Diseases"
+_NNID_LINKS = etree.XPath(f"//a[@href and contains(., '{NNID_TITLE}')]")
+
+# RSS 解析
+_DC_IDENTIFIER = "{http://purl.org/dc/elements/1.1/}identifier"
+
+
+def _iter_rss_items(source):
+    """
+    增量解析 RSS，逐个产出 <item> 元素
+    
+    调用方处理完当前元素后再清理它及之前的兄弟节点，内存只保留单个条目
+    """
+    context = etree.iterparse(source, events=("end",), tag="item",
+                              resolve_entities=False, no_network=True)
+    for _, elem in context:
+        yield elem
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _rss_item_to_dict(elem) -> Dict[str, Any]:
+    """
+    将 RSS <item> 元素转换为字典
+    
+    键名保留命名空间前缀（如 "dc:identifier"），重复出现的子元素合并为列表
+    """
+    item: Dict[str, Any] = {}
+    for child in elem:
+        if not isinstance(child.tag, str):
+            continue  # 跳过注释等非元素节点
+        name = etree.QName(child).localname
+        key = f"{child.prefix}:{name}" if child.prefix else name
+        if key in item:
+            if not isinstance(item[key], list):
+                item[key] = [item[key]]
+            item[key].append(child.text)
+        else:
+            item[key] = child.text
+    return item
+
 
 class ChinaCDCCrawler(BaseCrawler):
     """
@@ -40,13 +122,23 @@ class ChinaCDCCrawler(BaseCrawler):
     GOV_API_URL = "https://www.ndcpa.gov.cn/queryList"
     PUBMED_RSS_URL = "https://pubmed.ncbi.nlm.nih.gov/rss/search/1tQjT4yH2iuqFpDL7Y1nShJmC4kDC5_BJYgw4R1O0BCs-_Nemt/?limit=100&utm_campaign=pubmed-2&fc=20230905093742"
     
+    # fetch_list 的 source 参数与各数据源的对应关系
+    _CDC_SOURCES = frozenset({"cdc_weekly", "all"})
+    _GOV_SOURCES = frozenset({"nhc", "gov", "all"})
+    _PUBMED_SOURCES = frozenset({"pubmed", "all"})
+    
     def __init__(self):
         super().__init__(
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             timeout=30,
             max_retries=3,
             delay=1.0,
+            http_cache=True,  # 列表页很少变化，用条件请求避免重复下载
         )
+        # 数据库最新数据日期的查询任务（每次 crawl() 查询一次，各数据源共享）
+        self._max_date_task: Optional[asyncio.Future] = None
+        # 按URL（及解析参数）缓存解析结果：{(url, ...): (ETag/Last-Modified, 结果列表)}
+        self._parsed_results: Dict[tuple, Tuple[str, List[CrawlerResult]]] = {}
     
     @staticmethod
     def extract_date_en(text: str) -> Optional[str]:
@@ -60,16 +152,16 @@ class ChinaCDCCrawler(BaseCrawler):
             格式化的日期字符串 "2024 January"，如果未找到则返回None
         """
         # 移除HTML标签和特殊字符
-        text = re.sub(r"<[^>]+>", "", text)
-        text = re.sub(r"[^a-zA-Z0-9\s]", "", text)
+        text = _RE_HTML_TAG.sub("", text)
+        text = _RE_NON_ALNUM.sub("", text)
         
         # 匹配 "Month YYYY" 或 "YYYY Month" 格式
-        match = re.search(r"\b([A-Za-z]+)\s+(\d{4})\b", text)
+        match = _RE_MONTH_YEAR.search(text)
         if match:
             month, year = match.groups()
             return f"{year} {month.capitalize()}"
         
-        match = re.search(r"\b(\d{4})\s+([A-Za-z]+)\b", text)
+        match = _RE_YEAR_MONTH.search(text)
         if match:
             year, month = match.groups()
             return f"{year} {month.capitalize()}"
@@ -88,61 +180,106 @@ class ChinaCDCCrawler(BaseCrawler):
             格式化的日期字符串"2024 January"，如果未找到则返回None
         """
         # 移除HTML标签
-        text = re.sub(r"<[^>]+>", "", text)
+        text = _RE_HTML_TAG.sub("", text)
         
         # 匹配中文日期格式 "YYYY年MM月"
-        match = re.search(r"(\d{4})年(\d{1,2})月", text)
+        match = _RE_CN_DATE.search(text)
         if match:
             year, month = match.groups()
-            date_obj = datetime(int(year), int(month), 1)
-            return date_obj.strftime("%Y %B")
+            month = int(month)
+            if 1 <= month <= 12:
+                return f"{year} {_MONTH_NAMES[month]}"
         
         return None
     
-    async def fetch_list(self, source: str = "all", **kwargs) -> List[CrawlerResult]:
+    async def fetch_list(
+        self,
+        source: str = "all",
+        max_date: Optional[date] = None,
+        skip_known: bool = False,
+        **kwargs,
+    ) -> List[CrawlerResult]:
         """
         第一阶段：获取数据列表（轻量级操作）
         只获取标题、URL、日期等元信息，不爬取详细内容
         
         Args:
             source: 数据源 ("cdc_weekly", "nhc", "pubmed", "all")
+            max_date: 数据库已有的最新日期，不晚于该日期的报告在解析时直接跳过
+            skip_known: 未给出 max_date 时，在列表页下载成功后查询数据库最新日期并按其跳过
+                （各数据源共享一次查询，下载失败的数据源不访问数据库）
             **kwargs: 额外参数
             
         Returns:
             元信息列表（不含详细内容）
         """
-        results = []
-        
-        if source in ("cdc_weekly", "all"):
-            try:
-                cdc_results = self.crawl_cdc_weekly()
-                results.extend(cdc_results)
-                logger.info(f"CDC Weekly: 发现 {len(cdc_results)} 个报告")
-            except Exception as e:
-                logger.error(f"CDC Weekly 列表获取失败: {e}")
+        # 各数据源相互独立，并发获取，总耗时约等于最慢的一个数据源
+        jobs = []
+        if source in self._CDC_SOURCES:
+            jobs.append(("CDC Weekly", self.crawl_cdc_weekly(max_date, skip_known)))
+        if source in self._GOV_SOURCES:
+            jobs.append(("国家疾控局", self.crawl_gov(max_date, skip_known)))
+        if source in self._PUBMED_SOURCES:
+            jobs.append(("PubMed RSS", self.crawl_pubmed_rss(max_date, skip_known)))
         
-        if source in ("nhc", "gov", "all"):
-            try:
-                gov_results = self.crawl_gov()
-                results.extend(gov_results)
-                logger.info(f"国家疾控局: 发现 {len(gov_results)} 个报告")
-            except Exception as e:
-                logger.error(f"国家疾控局列表获取失败: {e}")
+        outcomes = await asyncio.gather(*(job for _, job in jobs), return_exceptions=True)
         
-        if source in ("pubmed", "all"):
-            try:
-                pubmed_results = self.crawl_pubmed_rss()
-                results.extend(pubmed_results)
-                logger.info(f"PubMed RSS: 发现 {len(pubmed_results)} 个报告")
-            except Exception as e:
-                logger.error(f"PubMed RSS 列表获取失败: {e}")
+        results = []
+        for (name, _), outcome in zip(jobs, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"{name} 列表获取失败: {outcome}")
+                continue
+            results.extend(outcome)
+            logger.info(f"{name}: 发现 {len(outcome)} 个报告")
         
-        # 按日期排序
-        results.sort(key=lambda x: x.date if x.date else datetime.min, reverse=True)
+        # 按日期倒序排序，无日期的报告排在最后
+        dated = [r for r in results if r.date is not None]
+        dated.sort(key=attrgetter("date"), reverse=True)
+        results = dated + [r for r in results if r.date is None]
         
         logger.info(f"总计发现 {len(results)} 个报告")
         return results
     
+    async def _get_max_date(self) -> Optional[date]:
+        """
+        获取数据库中最新的数据日期（排除未来日期）
+        
+        一次 crawl() 内只查询一次，并发的调用方共享同一个查询；crawl() 开始时重置
+        """
+        task = self._max_date_task
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = self._max_date_task = asyncio.ensure_future(self._query_max_date())
+        # shield：某个调用方被取消时不取消其他调用方共享的查询
+        return await asyncio.shield(task)
+    
+    async def _known_max_date(self, max_date: Optional[date], skip_known: bool) -> Optional[date]:
+        """解析列表时使用的过滤日期：显式给出的 max_date，或按需查询的数据库最新日期"""
+        if max_date is None and skip_known:
+            return await self._get_max_date()
+        return max_date
+    
+    async def _query_max_date(self) -> Optional[date]:
+        """查询数据库中最新的数据日期；数据库不可用时返回 None（不过滤）"""
+        try:
+            async with get_db() as session:
+                result = await session.execute(
+                    select(func.max(DiseaseRecord.time)).select_from(DiseaseRecord).where(
+                        DiseaseRecord.time <= date.today()
+                    )
+                )
+                max_time = result.scalar()
+        except Exception as e:
+            logger.warning(f"查询数据库最新日期失败，将爬取所有数据: {e}")
+            return None
+        
+        if not max_time:
+            logger.info("数据库为空，将爬取所有数据")
+            return None
+        
+        max_date = max_time.date()
+        logger.info(f"数据库中最新数据时间: {max_date} (排除未来日期)")
+        return max_date
+    
     async def check_new_data(self, list_results: List[CrawlerResult]) -> Dict[str, List[CrawlerResult]]:
         """
         第二阶段：检查哪些数据是新的（与数据库对比）
@@ -158,41 +295,20 @@ class ChinaCDCCrawler(BaseCrawler):
         Returns:
             字典，包含 'new' 和 'existing' 两个键
         """
-        from datetime import date
-        today = date.today()
-        
-        # 获取数据库中最新的数据时间（排除未来日期）
-        async with get_db() as session:
-            result = await session.execute(
-                select(func.max(DiseaseRecord.time)).select_from(DiseaseRecord).where(
-                    DiseaseRecord.time <= today
-                )
-            )
-            max_time = result.scalar()
-        
-        if max_time:
-            max_date = max_time.date()
-            logger.info(f"数据库中最新数据时间: {max_date} (排除未来日期)")
-        else:
-            max_date = None
-            logger.info("数据库为空，将爬取所有数据")
-        
-        # 筛选出时间晚于数据库最新时间的报告
-        new_results = []
-        existing_results = []
+        max_date = await self._get_max_date()
         
         for result in list_results:
             if result.date is None:
                 logger.warning(f"报告缺少日期信息，跳过: {result.title}")
-                continue
-            
-            result_date = result.date.date() if hasattr(result.date, 'date') else result.date
-            
-            # 如果数据库为空，或报告时间晚于数据库最新时间，则需要爬取
-            if max_date is None or result_date > max_date:
-                new_results.append(result)
-            else:
-                existing_results.append(result)
+        
+        # 筛选出时间晚于数据库最新时间的报告（数据库为空时全部视为新数据）
+        cutoff = max_date or date.min
+        dated = [
+            (r, r.date.date() if isinstance(r.date, datetime) else r.date)
+            for r in list_results if r.date is not None
+        ]
+        new_results = [r for r, d in dated if d > cutoff]
+        existing_results = [r for r, d in dated if d <= cutoff]
         
         logger.info(f"发现 {len(new_results)} 个新报告需要爬取（时间 > {max_date}）")
         if new_results:
@@ -220,9 +336,11 @@ class ChinaCDCCrawler(BaseCrawler):
         Returns:
             爬取的新数据列表
         """
-        # 第一阶段：获取列表
+        self._max_date_task = None
+        
+        # 第一阶段：获取列表（列表页下载成功后才查询数据库，解析时跳过已有的报告）
         logger.info("[阶段1/3] 获取数据列表...")
-        list_results = await self.fetch_list(source=source, **kwargs)
+        list_results = await self.fetch_list(source=source, skip_known=not force, **kwargs)
         
         if not list_results:
             logger.warning("未发现任何数据")
@@ -246,13 +364,33 @@ class ChinaCDCCrawler(BaseCrawler):
         
         return new_results
     
-    def crawl_cdc_weekly(self) -> List[CrawlerResult]:
-        """爬取 China CDC Weekly 数据"""
-        response = self.get(self.CDC_WEEKLY_URL)
-        return self.parse_cdc_weekly(response)
+    def _parse_unless_unchanged(self, url: str, response, parser, *args) -> List[CrawlerResult]:
+        """
+        页面校验值（ETag/Last-Modified）未变化时直接复用上次的解析结果
+        
+        BaseCrawler 已对GET做条件请求，服务器返回304时响应体来自缓存，
+        这里进一步跳过重复解析。
+        """
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        key = (url, *args)
+        cached = self._parsed_results.get(key)
+        if validator and cached and cached[0] == validator:
+            logger.debug(f"{url} 未变化，复用解析结果")
+            return list(cached[1])
+        
+        results = parser(response, *args)
+        if validator:
+            self._parsed_results[key] = (validator, results)
+        return list(results)
+    
+    async def crawl_cdc_weekly(self, max_date: Optional[date] = None, skip_known: bool = False) -> List[CrawlerResult]:
+        """爬取 China CDC Weekly 数据（max_date 见 parse_cdc_weekly，skip_known 见 fetch_list）"""
+        response = await self.aget(self.CDC_WEEKLY_URL)
+        max_date = await self._known_max_date(max_date, skip_known)
+        return self._parse_unless_unchanged(self.CDC_WEEKLY_URL, response, self.parse_cdc_weekly, max_date)
     
-    def crawl_gov(self) -> List[CrawlerResult]:
-        """爬取国家疾控局(GOV)数据"""
+    async def crawl_gov(self, max_date: Optional[date] = None, skip_known: bool = False) -> List[CrawlerResult]:
+        """爬取国家疾控局(GOV)数据（max_date 见 parse_cdc_weekly，skip_known 见 fetch_list）"""
         # 国家疾控局使用POST请求
         form_data = {
             'current': '1', 
@@ -260,77 +398,90 @@ class ChinaCDCCrawler(BaseCrawler):
             'webSiteCode[]': 'jbkzzx',
             'channelCode[]': 'c100016'
         }
-        response = self.post(self.GOV_API_URL, data=form_data)
-        return self.parse_gov(response)
+        response = await self.apost(self.GOV_API_URL, data=form_data)
+        max_date = await self._known_max_date(max_date, skip_known)
+        return self.parse_gov(response, max_date)
     
-    def crawl_pubmed_rss(self) -> List[CrawlerResult]:
-        """爬取 PubMed RSS 数据"""
-        if not hasattr(self, 'PUBMED_RSS_URL') or not self.PUBMED_RSS_URL:
+    async def crawl_pubmed_rss(self, max_date: Optional[date] = None, skip_known: bool = False) -> List[CrawlerResult]:
+        """爬取 PubMed RSS 数据（max_date 见 parse_cdc_weekly，skip_known 见 fetch_list）"""
+        if not self.PUBMED_RSS_URL:
             logger.warning("PubMed RSS URL 未配置")
             return []
         
-        response = self.get(self.PUBMED_RSS_URL)
-        return self.parse_pubmed_rss(response)
+        response = await self.aget(self.PUBMED_RSS_URL)
+        max_date = await self._known_max_date(max_date, skip_known)
+        return self._parse_unless_unchanged(self.PUBMED_RSS_URL, response, self.parse_pubmed_rss, max_date)
     
     def parse(self, response) -> List[CrawlerResult]:
         """通用解析方法（根据来源分发）"""
         # 这个方法在子类中被具体的 parse_* 方法替代
         return []
     
-    def parse_cdc_weekly(self, response) -> List[CrawlerResult]:
-        """解析 CDC Weekly 页面"""
-        soup = BeautifulSoup(response.text, "html.parser")
+    def parse_cdc_weekly(self, response, max_date: Optional[date] = None) -> List[CrawlerResult]:
+        """
+        解析 CDC Weekly 页面
+        
+        Args:
+            response: HTTP响应对象
+            max_date: 若提供，跳过不晚于该日期的报告（数据库中已有），不再构造结果对象
+        """
+        tree = etree.HTML(response.text)
         results = []
+        if tree is None:
+            return results
         
-        # 查找所有包含"National Notifiable Infectious Diseases"的链接
-        for a_tag in soup.find_all("a", href=True):
-            text = a_tag.text.strip()
-            if "National Notifiable Infectious Diseases" in text:
-                # 提取日期
-                year_month = self.extract_date_en(text)
-                if not year_month:
-                    continue
-                
-                # 提取DOI
-                link = a_tag.get("href")
-                doi = None
-                if "doi" in link:
-                    doi = link.split("doi/")[1] if "doi/" in link else link
-                
-                # 解析日期对象
-                try:
-                    date_obj = datetime.strptime(year_month, "%Y %B")
-                except ValueError:
-                    logger.warning(f"无法解析日期: {year_month}")
-                    continue
-                
-                # 构造完整URL
-                full_url = urljoin(self.CDC_WEEKLY_URL, link)
-                
-                result = CrawlerResult(
-                    title=text,
-                    url=full_url,
-                    date=date_obj,
-                    year_month=year_month,
-                    metadata={
-                        "source": "China CDC Weekly",
-                        "origin": "CN",
-                        "doi": doi,
-                        "language": "en",
-                    },
-                    raw_data={
-                        "original_link": link,
-                        "original_text": text,
-                    },
-                )
-                results.append(result)
+        # 查找所有包含"National Notifiable Infectious Diseases"的链接（在XPath中过滤）
+        for a_tag in _NNID_LINKS(tree):
+            text = "".join(a_tag.itertext()).strip()
+            
+            # 提取日期
+            year_month = self.extract_date_en(text)
+            if not year_month:
+                continue
+            
+            # 提取DOI
+            link = a_tag.get("href")
+            doi = None
+            if "doi" in link:
+                doi = link.split("doi/")[1] if "doi/" in link else link
+            
+            # 解析日期对象
+            try:
+                date_obj = _ym_to_date(year_month)
+            except ValueError:
+                logger.warning(f"无法解析日期: {year_month}")
+                continue
+            
+            if max_date is not None and date_obj.date() <= max_date:
+                continue
+            
+            # 构造完整URL
+            full_url = urljoin(self.CDC_WEEKLY_URL, link)
+            
+            result = CrawlerResult(
+                title=text,
+                url=full_url,
+                date=date_obj,
+                year_month=year_month,
+                metadata={
+                    "source": "China CDC Weekly",
+                    "origin": "CN",
+                    "doi": doi,
+                    "language": "en",
+                },
+                raw_data={
+                    "original_link": link,
+                    "original_text": text,
+                },
+            )
+            results.append(result)
         
         return results
 
-    def parse_gov(self, response) -> List[CrawlerResult]:
-        """解析国家疾控局API响应"""
+    def parse_gov(self, response, max_date: Optional[date] = None) -> List[CrawlerResult]:
+        """解析国家疾控局API响应（max_date 含义同 parse_cdc_weekly）"""
         try:
-            data = response.json()
+            data = _json_loads(response.content)
             items = data.get("data", {}).get("results", [])
         except Exception as e:
             logger.error(f"解析GOV数据失败: {e}")
@@ -349,11 +500,12 @@ class ChinaCDCCrawler(BaseCrawler):
                     continue
                 
                 # 解析日期对象
-                date_obj = datetime.strptime(year_month, "%Y %B")
+                date_obj = _ym_to_date(year_month)
+                if max_date is not None and date_obj.date() <= max_date:
+                    continue
                 
                 # 解析URL
-                import json
-                url = json.loads(urls).get("common", "") if urls else ""
+                url = _json_loads(urls).get("common", "") if urls else ""
                 full_url = urljoin(self.GOV_API_URL, url) if url else None
                 
                 result = CrawlerResult(
@@ -375,63 +527,60 @@ class ChinaCDCCrawler(BaseCrawler):
         
         return results
     
-    def parse_pubmed_rss(self, response) -> List[CrawlerResult]:
-        """解析 PubMed RSS Feed"""
-        try:
-            rss_data = xmltodict.parse(response.content)
-            items = rss_data.get("rss", {}).get("channel", {}).get("item", [])
-        except Exception as e:
-            logger.error(f"解析PubMed RSS失败: {e}")
-            return []
-        
+    def parse_pubmed_rss(self, response, max_date: Optional[date] = None) -> List[CrawlerResult]:
+        """解析 PubMed RSS Feed（max_date 含义同 parse_cdc_weekly）"""
         results = []
-        for item in items:
-            try:
-                title = item.get("title", "")
-                
-                # 提取日期
-                year_month = self.extract_date_en(title)
-                if not year_month:
+        try:
+            for elem in _iter_rss_items(io.BytesIO(response.content)):
+                try:
+                    item = _rss_item_to_dict(elem)
+                    title = item.get("title") or ""
+                    
+                    # 提取日期
+                    year_month = self.extract_date_en(title)
+                    if not year_month:
+                        continue
+                    
+                    # 解析日期对象
+                    date_obj = _ym_to_date(year_month)
+                    if max_date is not None and date_obj.date() <= max_date:
+                        continue
+                    
+                    # 获取原始PubMed URL
+                    pubmed_url = item.get("link")
+                    
+                    # 从 dc:identifier 中提取 PMCID
+                    pmc_url = None
+                    identifiers = [e.text for e in elem.iterfind(_DC_IDENTIFIER)]
+                    
+                    pmcid = None
+                    for identifier in identifiers:
+                        if isinstance(identifier, str) and identifier.startswith("pmc:PMC"):
+                            pmcid = identifier.replace("pmc:PMC", "")
+                            pmc_url = f"https://pmc.ncbi.nlm.nih.gov/articles/PMC{pmcid}/"
+                            break
+                    
+                    result = CrawlerResult(
+                        title=title,
+                        url=pmc_url or pubmed_url,  # 优先使用PMC URL
+                        date=date_obj,
+                        year_month=year_month,
+                        metadata={
+                            "source": "PubMed",
+                            "origin": "CN",
+                            "doi": item.get("dc:identifier"),
+                            "pub_date": item.get("pubDate"),
+                            "language": "en",
+                            "pubmed_url": pubmed_url,  # 保存原始PubMed URL
+                            "pmcid": pmcid,  # 保存PMCID用于调试
+                        },
+                        raw_data=item,
+                    )
+                    results.append(result)
+                except Exception as e:
+                    logger.warning(f"解析单条RSS记录失败: {e}")
                     continue
-                
-                # 解析日期对象
-                date_obj = datetime.strptime(year_month, "%Y %B")
-                
-                # 获取原始PubMed URL
-                pubmed_url = item.get("link")
-                
-                # 从 dc:identifier 中提取 PMCID
-                pmc_url = None
-                identifiers = item.get("dc:identifier", [])
-                if not isinstance(identifiers, list):
-                    identifiers = [identifiers]
-                
-                pmcid = None
-                for identifier in identifiers:
-                    if isinstance(identifier, str) and identifier.startswith("pmc:PMC"):
-                        pmcid = identifier.replace("pmc:PMC", "")
-                        pmc_url = f"https://pmc.ncbi.nlm.nih.gov/articles/PMC{pmcid}/"
-                        break
-                
-                result = CrawlerResult(
-                    title=title,
-                    url=pmc_url or pubmed_url,  # 优先使用PMC URL
-                    date=date_obj,
-                    year_month=year_month,
-                    metadata={
-                        "source": "PubMed",
-                        "origin": "CN",
-                        "doi": item.get("dc:identifier"),
-                        "pub_date": item.get("pubDate"),
-                        "language": "en",
-                        "pubmed_url": pubmed_url,  # 保存原始PubMed URL
-                        "pmcid": pmcid,  # 保存PMCID用于调试
-                    },
-                    raw_data=item,
-                )
-                results.append(result)
-            except Exception as e:
-                logger.warning(f"解析单条RSS记录失败: {e}")
-                continue
+        except etree.XMLSyntaxError as e:
+            logger.error(f"解析PubMed RSS失败: {e}")
         
         return results
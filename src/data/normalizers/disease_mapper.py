@@ -6,16 +6,55 @@ GlobalID V2 Disease Mapper
 - 支持多国家本地名称映射到标准disease_id
 - 适配不同国家的疾病命名差异
 """
+import copy
+import csv
+from collections import abc
+import re
+import sys
+import threading
+import unicodedata
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+from dataclasses import dataclass, fields
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
+from pyarrow import feather
 
 from src.core import get_logger
 
 logger = get_logger(__name__)
 
+# 配置文件路径
+STANDARD_FILE = Path("configs/standard_diseases.csv")
+MAPPING_FILE_TEMPLATE = "configs/{country_code}/disease_mapping.csv"
+
+# 名称清理规则：移除中英文括号内容及常见后缀
+_PAREN_ASCII = re.compile(r"\([^)]*\)")
+_PAREN_CJK = re.compile(r"（[^）]*）")
+_SUFFIXES = ("病", "症", "热")
+
+# 文本列统一使用 Arrow 字符串类型，strip/replace 等字符串操作在原生代码中执行
+_ARROW_STRING = pd.StringDtype("pyarrow")
+
+# 子串匹配（仅生成审核建议）：查询名称至少这么长才尝试，参与匹配的已知名称至少3个字符
+# （"流感"、"SARS" 之类的短名称嵌在其他病名中时多半是另一种疾病）
+_MIN_SUBSTRING_QUERY_LEN = 4
+_MIN_SUBSTRING_KEY_LEN = 3
+# 拉丁字母名称的词边界：两侧不能紧邻字母、数字或连字符（"SARS-CoV-2" 不含 "SARS"）
+_WORD_CHAR = re.compile(r"[A-Za-z0-9\-]")
+
+# pyahocorasick 为可选依赖，未安装时回退到按名称长度逐个查找子串
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 @dataclass
 class StandardDisease:
@@ -39,6 +78,101 @@ class LocalMapping:
     aliases: List[str]
 
 
+_STANDARD_FIELDS = tuple(f.name for f in fields(StandardDisease))
+
+# 标准疾病库缓存（进程内只加载一次）：文件路径 -> (修改时间, 行号索引, 字段列)
+_STANDARD_TABLES: Dict[Path, Tuple[Optional[float], Mapping[str, int], Mapping[str, np.ndarray]]] = {}
+_STANDARD_LOCK = threading.Lock()
+
+# DiseaseMapper.get() 的实例缓存：country_code -> (配置文件修改时间, 已加载的映射器)
+_MAPPER_CACHE: Dict[str, Tuple[tuple, "DiseaseMapper"]] = {}
+_MAPPER_CACHE_LOCK = threading.Lock()
+
+
+def _load_config_table(path: Path) -> pd.DataFrame:
+    """
+    读取配置CSV为已去除首尾空白的字符串表（空值为""）
+    
+    解析结果写入同目录的 .feather 缓存文件；缓存不比CSV旧时直接内存映射读取，
+    跳过CSV解析。缓存写入失败（如目录只读）不影响加载。
+    
+    Args:
+        path: CSV文件路径
+        
+    Returns:
+        DataFrame（所有列为Arrow字符串类型）
+    """
+    sidecar = path.with_suffix(".feather")
+    if sidecar.exists() and sidecar.stat().st_mtime >= path.stat().st_mtime:
+        try:
+            return feather.read_table(sidecar, memory_map=True).to_pandas()
+        except Exception as e:
+            logger.warning(f"读取缓存文件失败，重新解析CSV: {sidecar}: {e}")
+    
+    # 所有列按字符串读取（避免 ICD 编码如 "1E91" 被推断为数字），去空白在 Arrow 中完成
+    with open(path, encoding="utf-8", newline="") as f:
+        header = next(csv.reader(f), [])
+    table = pacsv.read_csv(
+        path,
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=False,
+        ),
+    )
+    table = pa.table(
+        [pc.utf8_trim_whitespace(column) for column in table.columns],
+        names=table.column_names,
+    )
+    df = table.to_pandas(types_mapper={pa.string(): _ARROW_STRING}.get)
+    
+    try:
+        feather.write_feather(df, sidecar, compression="uncompressed")
+    except Exception as e:
+        logger.debug(f"写入缓存文件失败: {sidecar}: {e}")
+    return df
+
+
+def _mtime(path: Path) -> Optional[float]:
+    """文件修改时间（文件不存在时为None）"""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+class _StandardDiseaseView(abc.Mapping):
+    """disease_id -> StandardDisease 的只读视图（不复制列数据，查找为O(1)）"""
+    
+    __slots__ = ("_mapper",)
+    
+    def __init__(self, mapper: "DiseaseMapper"):
+        self._mapper = mapper
+    
+    def __getitem__(self, disease_id: str) -> StandardDisease:
+        disease = self._mapper.get_standard_disease(disease_id)
+        if disease is None:
+            raise KeyError(disease_id)
+        return disease
+    
+    def __contains__(self, disease_id) -> bool:
+        return disease_id in self._mapper._std_idx
+    
+    def __iter__(self):
+        return iter(self._mapper._std_idx)
+    
+    def __len__(self) -> int:
+        return len(self._mapper._std_idx)
+
+
+def _on_word_boundary(name: str, start: int, end: int) -> bool:
+    """子串 name[start:end] 两端是否在词边界上（仅约束拉丁字母数字端点，中文不分词）"""
+    if _WORD_CHAR.match(name[start]) and start > 0 and _WORD_CHAR.match(name[start - 1]):
+        return False
+    if _WORD_CHAR.match(name[end - 1]) and end < len(name) and _WORD_CHAR.match(name[end]):
+        return False
+    return True
+
+
 class DiseaseMapper:
     """
     国际化疾病名称映射器
@@ -59,21 +193,26 @@ class DiseaseMapper:
         local_name = mapper.map_id_to_local("D004")  # -> "新型冠状病毒感染"
     """
     
-    def __init__(self, country_code: str = "cn"):
+    def __init__(self, country_code: str = "cn", substring_match: bool = False):
         """
         初始化疾病映射器
         
         Args:
             country_code: 国家代码（cn/us/uk等），对应configs/{country_code}/目录
+            substring_match: 是否为未识别名称查找嵌在其中的已知名称，作为审核建议
+                （只记录到 substring_suggestions，不会作为映射结果返回）
         """
         self.country_code = country_code
+        self.substring_match = substring_match
         
         # 文件路径
-        self.standard_file = Path("configs/standard_diseases.csv")
-        self.mapping_file = Path(f"configs/{country_code}/disease_mapping.csv")
+        self.standard_file = STANDARD_FILE
+        self.mapping_file = Path(MAPPING_FILE_TEMPLATE.format(country_code=country_code))
         
-        # 标准疾病库（全局）
-        self.standard_diseases: Dict[str, StandardDisease] = {}
+        # 标准疾病库（全局，按列存储）：disease_id -> 行号，以及每个字段一列定长字符串数组；
+        # 进程内所有映射器共享同一份只读数据
+        self._std_idx: Mapping[str, int] = MappingProxyType({})
+        self._std_columns: Mapping[str, np.ndarray] = MappingProxyType({})
         
         # 本地映射表（国家特定）
         self.local_mappings: Dict[str, LocalMapping] = {}
@@ -84,14 +223,61 @@ class DiseaseMapper:
         
         # 未识别的疾病（需要人工审核）
         self.unknown_diseases: Set[str] = set()
+        # 未识别名称的子串匹配建议：名称 -> 建议的disease_id（需人工确认）
+        self.substring_suggestions: Dict[str, str] = {}
+        
+        # 子串匹配索引（首次使用时构建，映射变化后重建）
+        self._substring_index = None
+        
+        # 名称解析结果缓存（按实例，映射变化时清空）
+        self._resolve_cached = lru_cache(maxsize=65536)(self._resolve)
         
         # 加载数据
         self._load_standard_diseases()
         self._load_local_mappings()
 
+    @classmethod
+    def get(cls, country_code: str = "cn", substring_match: bool = False) -> "DiseaseMapper":
+        """
+        获取映射器（复用已解析的配置，配置文件修改后自动重新加载）
+        
+        返回的映射器与缓存实例共享映射表，但未识别疾病记录各自独立；
+        add_temporary_mapping 会先复制映射表，不影响其他调用方。
+        
+        Args:
+            country_code: 国家代码
+            substring_match: 是否生成子串匹配审核建议（见 __init__）
+            
+        Returns:
+            DiseaseMapper实例
+        """
+        mtimes = (
+            _mtime(STANDARD_FILE),
+            _mtime(Path(MAPPING_FILE_TEMPLATE.format(country_code=country_code))),
+        )
+        with _MAPPER_CACHE_LOCK:
+            cached = _MAPPER_CACHE.get(country_code)
+            if cached is None or cached[0] != mtimes:
+                cached = (mtimes, cls(country_code))
+                _MAPPER_CACHE[country_code] = cached
+        
+        mapper = copy.copy(cached[1])
+        mapper.substring_match = substring_match
+        mapper.unknown_diseases = set()
+        mapper.substring_suggestions = {}
+        return mapper
+    
+    @property
+    def standard_diseases(self) -> Mapping[str, StandardDisease]:
+        """标准疾病库（兼容旧接口）：只读视图，按键查找时才从列数据构建单个对象"""
+        return _StandardDiseaseView(self)
+    
     def get_standard_disease(self, disease_id: str) -> Optional[StandardDisease]:
-        """获取标准疾病信息"""
-        return self.standard_diseases.get(disease_id)
+        """获取标准疾病信息（从列数据构建）"""
+        i = self._std_idx.get(disease_id)
+        if i is None:
+            return None
+        return StandardDisease(**{name: str(column[i]) for name, column in self._std_columns.items()})
     
     def _load_standard_diseases(self):
         """加载标准疾病库"""
@@ -100,21 +286,25 @@ class DiseaseMapper:
             return
         
         try:
-            df = pd.read_csv(self.standard_file)
+            mtime = _mtime(self.standard_file)
+            with _STANDARD_LOCK:
+                cached = _STANDARD_TABLES.get(self.standard_file)
+                if cached is None or cached[0] != mtime:
+                    df = _load_config_table(self.standard_file)
+                    
+                    # 同一disease_id出现多次时以最后一行为准
+                    std_idx = {disease_id: i for i, disease_id in enumerate(df['disease_id'])}
+                    std_columns = {}
+                    for name in _STANDARD_FIELDS:
+                        column = df[name].to_numpy(dtype=str)
+                        column.setflags(write=False)
+                        std_columns[name] = column
+                    
+                    cached = (mtime, MappingProxyType(std_idx), MappingProxyType(std_columns))
+                    _STANDARD_TABLES[self.standard_file] = cached
+                    logger.info(f"✅ 加载标准疾病库: {len(std_idx)} 条疾病")
             
-            for _, row in df.iterrows():
-                disease = StandardDisease(
-                    disease_id=str(row['disease_id']).strip(),
-                    standard_name_en=str(row['standard_name_en']).strip(),
-                    standard_name_zh=str(row['standard_name_zh']).strip(),
-                    category=str(row['category']).strip(),
-                    icd_10=str(row['icd_10']).strip() if pd.notna(row['icd_10']) else "",
-                    icd_11=str(row['icd_11']).strip() if pd.notna(row['icd_11']) else "",
-                    description=str(row['description']).strip() if pd.notna(row['description']) else "",
-                )
-                self.standard_diseases[disease.disease_id] = disease
-            
-            logger.info(f"✅ 加载标准疾病库: {len(self.standard_diseases)} 条疾病")
+            _, self._std_idx, self._std_columns = cached
             
         except Exception as e:
             logger.error(f"加载标准疾病库失败: {e}")
@@ -128,35 +318,34 @@ class DiseaseMapper:
             return
         
         try:
-            df = pd.read_csv(self.mapping_file)
+            df = _load_config_table(self.mapping_file)
             
-            for _, row in df.iterrows():
-                disease_id = str(row['disease_id']).strip()
-                local_name = str(row['local_name']).strip()
-                
-                # 解析别名
-                aliases_str = str(row.get('aliases', ''))
-                aliases = []
-                if aliases_str and aliases_str != 'nan':
-                    aliases = [a.strip() for a in aliases_str.split('|') if a.strip()]
+            # 解析别名（整列一次拆分）
+            if 'aliases' in df:
+                alias_lists = df['aliases'].str.split('|')
+            else:
+                alias_lists = [[]] * len(df)
+            
+            for disease_id, local_name, local_code, category, alias_parts in zip(
+                df['disease_id'], df['local_name'], df['local_code'], df['category'], alias_lists,
+            ):
+                aliases = [a.strip() for a in alias_parts if a.strip()]
                 
-                mapping = LocalMapping(
+                self.local_mappings[local_name] = LocalMapping(
                     disease_id=disease_id,
                     local_name=local_name,
-                    local_code=str(row['local_code']).strip(),
-                    category=str(row['category']).strip(),
+                    local_code=local_code,
+                    category=category,
                     aliases=aliases,
                 )
                 
-                self.local_mappings[local_name] = mapping
-                
                 # 建立索引
-                self.local_to_id[local_name] = disease_id
+                self._register_name(local_name, disease_id)
                 self.id_to_local[disease_id] = local_name
                 
                 # 添加别名映射
                 for alias in aliases:
-                    self.local_to_id[alias] = disease_id
+                    self._register_name(alias, disease_id)
             
             logger.info(f"✅ 加载国家映射 ({self.country_code.upper()}): {len(self.local_mappings)} 条主映射, "
                        f"总计 {len(self.local_to_id)} 个可识别名称（含别名）")
@@ -166,6 +355,13 @@ class DiseaseMapper:
             import traceback
             traceback.print_exc()
     
+    def _register_name(self, name: str, disease_id: str):
+        """登记可识别名称，同时登记其NFKC规范化形式（全角字母、括号等），键做字符串驻留"""
+        self.local_to_id[sys.intern(name)] = disease_id
+        normalized = unicodedata.normalize("NFKC", name)
+        if normalized != name:
+            self.local_to_id.setdefault(sys.intern(normalized), disease_id)
+    
     def map_local_to_id(self, local_name: str) -> Optional[str]:
         """
         将本地疾病名称映射为标准disease_id
@@ -176,21 +372,45 @@ class DiseaseMapper:
         Returns:
             标准disease_id（如"D004"），未找到返回None
         """
+        # 快速路径：已规范的名称直接命中，无需去空白
+        disease_id = self.local_to_id.get(local_name)
+        if disease_id:
+            return disease_id
+        
+        disease_id = self._resolve_cached(local_name)
+        if disease_id:
+            return disease_id
+        
+        # 记录未识别的疾病
+        self._record_unknown(local_name.strip())
+        return None
+    
+    def _record_unknown(self, local_name: str):
+        """记录未识别的疾病；启用子串匹配时附带建议的disease_id供人工审核"""
+        self.unknown_diseases.add(local_name)
+        suggestion = self._suggest_substring(unicodedata.normalize("NFKC", local_name)) if self.substring_match else None
+        if suggestion:
+            self.substring_suggestions[local_name] = suggestion
+            logger.warning(f"❌ 未找到本地疾病映射 ({self.country_code}): {local_name}（子串匹配建议: {suggestion}，待审核）")
+        else:
+            logger.warning(f"❌ 未找到本地疾病映射 ({self.country_code}): {local_name}")
+    
+    def _resolve(self, local_name: str) -> Optional[str]:
+        """解析本地名称（精确匹配 → NFKC规范化后匹配 → 清理后匹配），结果由 _resolve_cached 缓存"""
         local_name = local_name.strip()
         
         # 精确匹配
         if local_name in self.local_to_id:
             return self.local_to_id[local_name]
         
+        # 规范化匹配（全角字符等）
+        local_name = unicodedata.normalize("NFKC", local_name)
+        if local_name in self.local_to_id:
+            return self.local_to_id[local_name]
+        
         # 模糊匹配（移除常见前后缀）
         cleaned_name = self._clean_disease_name(local_name)
-        if cleaned_name in self.local_to_id:
-            return self.local_to_id[cleaned_name]
-        
-        # 记录未识别的疾病
-        self.unknown_diseases.add(local_name)
-        logger.warning(f"❌ 未找到本地疾病映射 ({self.country_code}): {local_name}")
-        return None
+        return self.local_to_id.get(cleaned_name)
     
     def get_standard_name(self, disease_id: str, lang: str = "en") -> Optional[str]:
         """
@@ -203,11 +423,12 @@ class DiseaseMapper:
         Returns:
             标准名称，未找到返回None
         """
-        if disease_id not in self.standard_diseases:
+        i = self._std_idx.get(disease_id)
+        if i is None:
             return None
         
-        disease = self.standard_diseases[disease_id]
-        return disease.standard_name_en if lang == "en" else disease.standard_name_zh
+        column = self._std_columns["standard_name_en" if lang == "en" else "standard_name_zh"]
+        return str(column[i])
     
     def map_id_to_local(self, disease_id: str) -> Optional[str]:
         """
@@ -248,14 +469,15 @@ class DiseaseMapper:
         Returns:
             StandardDisease对象，未找到返回None
         """
-        return self.standard_diseases.get(disease_id)
+        return self.get_standard_disease(disease_id)
     
     def map_dataframe(self, 
                      df: pd.DataFrame, 
                      source_col: str, 
                      target_col: str = None,
                      add_id_col: bool = True,
-                     add_standard_col: bool = True) -> pd.DataFrame:
+                     add_standard_col: bool = True,
+                     copy: bool = True) -> pd.DataFrame:
         """
         批量映射DataFrame中的疾病名称
         
@@ -265,6 +487,8 @@ class DiseaseMapper:
             target_col: 目标列名（标准英文名），默认为"Diseases"
             add_id_col: 是否添加disease_id列
             add_standard_col: 是否添加标准英文名列
+            copy: 是否在副本上添加列（与 DiseaseMapperDB.map_dataframe 一致）；
+                为False时直接修改传入的数据框，避免整表复制
             
         Returns:
             映射后的数据框
@@ -272,20 +496,146 @@ class DiseaseMapper:
         if target_col is None:
             target_col = "Diseases"
         
+        if copy:
+            df = df.copy()
+        
+        if not (add_id_col or add_standard_col):
+            return df
+        
+        disease_ids = self._map_series_to_ids(df[source_col])
+        
         # 映射到disease_id
         if add_id_col:
-            df['disease_id'] = df[source_col].apply(
-                lambda x: self.map_local_to_id(x) if pd.notna(x) and x else None
-            )
+            df['disease_id'] = disease_ids
         
         # 映射到标准英文名
         if add_standard_col:
-            df[target_col] = df[source_col].apply(
-                lambda x: self.map_local_to_standard(x, lang="en") if pd.notna(x) and x else None
-            )
+            df[target_col] = self._standard_column(disease_ids, "standard_name_en")
         
         return df
     
+    def _standard_column(self, disease_ids: pd.Series, field_name: str) -> pd.Series:
+        """
+        按disease_id列批量取标准疾病的某个字段（行号查表后整列取值）
+        
+        Args:
+            disease_ids: disease_id列（未命中为None）
+            field_name: StandardDisease字段名
+            
+        Returns:
+            与输入同索引的字段值列（object类型，未找到为None）
+        """
+        rows = disease_ids.map(self._std_idx)
+        found = rows.notna().to_numpy()
+        
+        values = np.full(len(disease_ids), None, dtype=object)
+        if found.any():
+            values[found] = self._std_columns[field_name][rows[found].to_numpy(dtype=np.int64)].tolist()
+        return pd.Series(values, index=disease_ids.index, dtype=object)
+    
+    def _map_series_to_ids(self, names: pd.Series) -> pd.Series:
+        """
+        将整列本地疾病名称映射为disease_id（向量化）
+        
+        先把整列编码为唯一名称的整数编号，名称解析（字典映射、清理后映射）
+        只对唯一名称进行，最后按编号整列取值；
+        空值、空字符串和纯空白映射为None。
+        
+        Args:
+            names: 本地疾病名称列
+            
+        Returns:
+            与输入同索引的disease_id列（object类型，未命中为None）
+        """
+        stripped = names.astype(_ARROW_STRING).str.strip()
+        valid = (stripped.str.len() > 0).to_numpy(dtype=bool, na_value=False)
+        codes, uniques = pd.factorize(stripped[valid])
+        uniques = pd.Series(uniques)
+        
+        resolved = uniques.map(self.local_to_id)
+        miss = resolved.isna()
+        if miss.any():
+            # 规范化匹配（全角字符等）
+            normalized = uniques.str.normalize("NFKC")
+            resolved[miss] = normalized[miss].map(self.local_to_id)
+            
+            # 模糊匹配（移除常见前后缀）
+            miss = resolved.isna()
+            if miss.any():
+                resolved[miss] = self._clean_series(normalized[miss]).map(self.local_to_id)
+            
+            # 记录未识别的疾病（每个名称只记录一次）
+            for local_name in uniques[resolved.isna()]:
+                self._record_unknown(local_name)
+        
+        unique_ids = resolved.astype(object).where(resolved.notna(), None).to_numpy()
+        disease_ids = np.full(len(names), None, dtype=object)
+        disease_ids[valid] = unique_ids[codes]
+        return pd.Series(disease_ids, index=names.index, dtype=object)
+    
+    def _suggest_substring(self, name: str) -> Optional[str]:
+        """
+        查找嵌在未识别名称中的已知疾病名称，作为审核建议
+        
+        只接受足够长、两侧在词边界上（拉丁字母名称）、且不是其他疾病名称一部分的已知名称；
+        命中的名称必须全部指向同一个disease_id，否则不给建议。
+        安装了 pyahocorasick 时使用 Aho-Corasick 自动机一次扫描找出全部匹配，
+        否则逐个名称查找。
+        
+        Args:
+            name: 已去除首尾空白并做NFKC规范化的疾病名称
+            
+        Returns:
+            唯一建议的disease_id，无可靠建议时返回None
+        """
+        if len(name) < _MIN_SUBSTRING_QUERY_LEN:
+            return None
+        
+        if self._substring_index is None:
+            self._substring_index = self._build_substring_index()
+        
+        disease_ids = {
+            self.local_to_id[key]
+            for start, key in self._iter_substrings(name)
+            if _on_word_boundary(name, start, start + len(key))
+        }
+        return disease_ids.pop() if len(disease_ids) == 1 else None
+    
+    def _iter_substrings(self, name: str):
+        """逐个产出名称中出现的候选已知名称 (起始位置, 名称)"""
+        if ahocorasick is None:
+            for key in self._substring_index:
+                start = name.find(key)
+                while start >= 0:
+                    yield start, key
+                    start = name.find(key, start + 1)
+        elif len(self._substring_index):
+            for end, key in self._substring_index.iter(name):
+                yield end - len(key) + 1, key
+    
+    def _build_substring_index(self):
+        """
+        构建子串匹配索引（Aho-Corasick 自动机，或名称列表）
+        
+        包含在其他疾病名称中的名称（如 "出血热"、"Hepatitis"）是泛称，不参与匹配
+        """
+        keys = [key for key in self.local_to_id if len(key) >= _MIN_SUBSTRING_KEY_LEN]
+        generic = {
+            key for key in keys
+            if any(key in other and self.local_to_id[other] != self.local_to_id[key] for other in keys)
+        }
+        keys = [key for key in keys if key not in generic]
+        
+        if ahocorasick is None:
+            return keys
+        
+        automaton = ahocorasick.Automaton()
+        for key in keys:
+            automaton.add_word(key, key)
+        if keys:
+            automaton.make_automaton()
+        return automaton
+    
     def add_temporary_mapping(self, local_name: str, disease_id: str, aliases: List[str] = None):
         """
         临时添加映射（仅在内存中，不持久化）
@@ -297,11 +647,16 @@ class DiseaseMapper:
             disease_id: 标准疾病ID
             aliases: 别名列表
         """
-        self.local_to_id[local_name] = disease_id
+        # 写时复制：映射表可能与 DiseaseMapper.get() 缓存的实例共享
+        self.local_to_id = dict(self.local_to_id)
+        self._register_name(local_name, disease_id)
         
         if aliases:
             for alias in aliases:
-                self.local_to_id[alias] = disease_id
+                self._register_name(alias, disease_id)
+        
+        self._substring_index = None
+        self._resolve_cached = lru_cache(maxsize=65536)(self._resolve)
         
         logger.info(f"临时添加映射: {local_name} -> {disease_id}")
     
@@ -323,7 +678,11 @@ class DiseaseMapper:
                 f.write("# 需要添加到映射文件: configs/{}/disease_mapping.csv\n".format(self.country_code))
                 f.write("disease_id,local_name,local_code,category,aliases,data_source,notes\n")
                 for disease in sorted(self.unknown_diseases):
-                    f.write(f",{disease},,,,待审核\n")
+                    suggestion = self.substring_suggestions.get(disease)
+                    if suggestion:
+                        f.write(f"{suggestion},{disease},,,,待审核（子串匹配建议）\n")
+                    else:
+                        f.write(f",{disease},,,,待审核\n")
             
             logger.info(f"导出 {len(self.unknown_diseases)} 个未识别疾病到: {output_file}")
             
@@ -334,10 +693,11 @@ class DiseaseMapper:
         """获取映射统计信息"""
         return {
             "country_code": self.country_code,
-            "standard_diseases_count": len(self.standard_diseases),
+            "standard_diseases_count": len(self._std_idx),
             "local_mappings_count": len(self.local_mappings),
             "total_recognizable_names": len(self.local_to_id),
             "unknown_diseases_count": len(self.unknown_diseases),
+            "substring_suggestions_count": len(self.substring_suggestions),
         }
     
     @staticmethod
@@ -351,16 +711,32 @@ class DiseaseMapper:
         Returns:
             清理后的名称
         """
-        import re
-        
         # 移除括号内容
-        name = re.sub(r"\([^)]*\)", "", name)
-        name = re.sub(r"（[^）]*）", "", name)
+        name = _PAREN_ASCII.sub("", name)
+        name = _PAREN_CJK.sub("", name)
         
         # 移除常见后缀
-        suffixes = ["病", "症", "热"]
-        for suffix in suffixes:
+        for suffix in _SUFFIXES:
             if name.endswith(suffix) and len(name) > 2:
                 name = name[:-len(suffix)]
         
         return name.strip()
+    
+    @classmethod
+    def _clean_series(cls, names: pd.Series) -> pd.Series:
+        """
+        批量清理疾病名称（_clean_disease_name 的向量化版本）
+        
+        Args:
+            names: 疾病名称列
+            
+        Returns:
+            清理后的名称列
+        """
+        names = names.str.replace(_PAREN_ASCII, "", regex=True).str.replace(_PAREN_CJK, "", regex=True)
+        
+        for suffix in _SUFFIXES:
+            strip_mask = names.str.endswith(suffix) & (names.str.len() > 2)
+            names = names.where(~strip_mask, names.str[:-len(suffix)])
+        
+        return names.str.strip()
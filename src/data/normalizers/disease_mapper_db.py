@@ -3,7 +3,11 @@ GlobalID V2 Database-based Disease Mapper
 
 从PostgreSQL数据库读取疾病映射（支持动态更新）
 """
-from typing import Optional, Dict, List
+import asyncio
+import threading
+import time
+from collections import Counter
+from typing import Coroutine, Iterable, Optional, Dict, List
 from dataclasses import dataclass
 import pandas as pd
 from sqlalchemy import text
@@ -13,6 +17,76 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 使用统计和未知疾病缓冲：达到任一条件即批量写回数据库
+STATS_FLUSH_INTERVAL = 60.0  # 秒
+STATS_FLUSH_THRESHOLD = 500  # 缓冲的不同名称数
+
+# 热路径SQL在模块级构建一次：SQLAlchemy 复用编译结果，
+# 相同的SQL文本也能命中 asyncpg 按连接缓存的预编译语句
+
+# 单个名称映射
+_SQL_MAP_LOCAL = text("""
+    SELECT disease_id, usage_count
+    FROM disease_mappings
+    WHERE country_code = :country
+      AND local_name = :name
+      AND is_active = true
+    ORDER BY priority DESC, usage_count DESC
+    LIMIT 1
+""")
+
+# 批量名称映射（同时关联标准信息）
+_SQL_BULK_MAP_LOCAL = text("""
+    SELECT dm.local_name, dm.disease_id,
+           sd.standard_name_en, sd.standard_name_zh,
+           sd.category, sd.icd_10, sd.icd_11, sd.description
+    FROM disease_mappings dm
+    LEFT JOIN standard_diseases sd
+      ON sd.disease_id = dm.disease_id AND sd.is_active = true
+    WHERE dm.country_code = :country
+      AND dm.local_name = ANY(:names)
+      AND dm.is_active = true
+""")
+
+# 批量写回使用统计
+_SQL_FLUSH_USAGE = text("""
+    UPDATE disease_mappings AS dm
+    SET usage_count = dm.usage_count + u.cnt,
+        last_used_at = CURRENT_TIMESTAMP
+    FROM unnest(CAST(:names AS text[]), CAST(:counts AS integer[])) AS u(name, cnt)
+    WHERE dm.country_code = :country
+      AND dm.local_name = u.name
+""")
+
+# 批量写入未知疾病
+_SQL_FLUSH_UNKNOWN = text("""
+    INSERT INTO disease_learning_suggestions (
+        country_code, local_name,
+        occurrence_count, first_seen_at, last_seen_at
+    )
+    SELECT :country, u.name, u.cnt, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+    FROM unnest(CAST(:names AS text[]), CAST(:counts AS integer[])) AS u(name, cnt)
+    ON CONFLICT (country_code, local_name) DO UPDATE SET
+        occurrence_count = disease_learning_suggestions.occurrence_count + EXCLUDED.occurrence_count,
+        last_seen_at = EXCLUDED.last_seen_at
+""")
+
+# 单个标准信息
+_SQL_STANDARD_INFO = text("""
+    SELECT disease_id, standard_name_en, standard_name_zh,
+           category, icd_10, icd_11, description
+    FROM standard_diseases
+    WHERE disease_id = :did AND is_active = true
+""")
+
+# 批量标准信息
+_SQL_BULK_STANDARD_INFO = text("""
+    SELECT disease_id, standard_name_en, standard_name_zh,
+           category, icd_10, icd_11, description
+    FROM standard_diseases
+    WHERE disease_id = ANY(:ids) AND is_active = true
+""")
+
 
 @dataclass
 class DiseaseInfo:
@@ -41,6 +115,60 @@ class DiseaseMapperDB:
         self.country_code = country_code.upper() if country_code else country_code
         self._local_cache = {}  # 内存缓存
         self._standard_cache = {}
+        
+        # 使用统计和未知疾病先在内存中累加，定期批量写回，避免读路径上的逐条写入
+        self._usage_buffer: Counter = Counter()
+        self._unknown_buffer: Counter = Counter()
+        self._last_flush = time.monotonic()
+        
+        # warmup() 之后缓存包含当前国家的全部映射
+        self._warmed = False
+    
+    async def __aenter__(self) -> "DiseaseMapperDB":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """退出时写回缓冲的使用统计和未知疾病"""
+        await self.flush()
+    
+    async def warmup(self):
+        """
+        预热缓存：一次性加载当前国家的全部映射和全部标准疾病
+        
+        映射表规模通常只有几千行，预热后查询只走内存字典，
+        未命中的名称直接视为未知疾病而不再查询数据库。
+        其他进程对映射表的修改需要调用 clear_cache() 后重新预热才能生效。
+        """
+        async with get_db() as db:
+            result = await db.execute(
+                text("""
+                    SELECT local_name, disease_id
+                    FROM disease_mappings
+                    WHERE country_code = :country AND is_active = true
+                    ORDER BY priority ASC, usage_count ASC
+                """),
+                {"country": self.country_code}
+            )
+            mappings = result.fetchall()
+            
+            result = await db.execute(
+                text("""
+                    SELECT disease_id, standard_name_en, standard_name_zh,
+                           category, icd_10, icd_11, description
+                    FROM standard_diseases
+                    WHERE is_active = true
+                """)
+            )
+            standards = result.fetchall()
+        
+        # 按优先级升序写入，同名时保留优先级最高的映射
+        for local_name, disease_id in mappings:
+            self._local_cache[f"{self.country_code}:{local_name}"] = disease_id
+        for row in standards:
+            self._standard_cache[row[0]] = DiseaseInfo(*row)
+        
+        self._warmed = True
+        logger.info(f"✅ 疾病映射缓存已预热 ({self.country_code}): {len(mappings)} 条映射, {len(standards)} 条标准疾病")
     
     async def map_local_to_id(self, local_name: str) -> Optional[str]:
         """
@@ -55,62 +183,161 @@ class DiseaseMapperDB:
         # 检查内存缓存
         cache_key = f"{self.country_code}:{local_name}"
         if cache_key in self._local_cache:
+            await self._count_usage([local_name])
             return self._local_cache[cache_key]
         
+        if self._warmed:
+            return await self._resolve_unmapped(local_name)
+        
         async with get_db() as db:
             result = await db.execute(
-                text("""
-                    SELECT disease_id, usage_count
-                    FROM disease_mappings
-                    WHERE country_code = :country
-                      AND local_name = :name
-                      AND is_active = true
-                    ORDER BY priority DESC, usage_count DESC
-                    LIMIT 1
-                """),
+                _SQL_MAP_LOCAL,
                 {"country": self.country_code, "name": local_name}
             )
             row = result.fetchone()
+        
+        if not row:
+            return await self._resolve_unmapped(local_name)
+        
+        # 缓存结果
+        disease_id = row[0]
+        self._local_cache[cache_key] = disease_id
+        await self._count_usage([local_name])
+        return disease_id
+    
+    async def batch_map_local_to_id(self, names: List[str]) -> List[Optional[str]]:
+        """
+        批量 本地名称 → disease_id，结果与输入顺序一致
+        
+        重复名称只解析一次：缓存未命中的名称合并为一次数据库查询，
+        仍未找到的再逐个交给 _resolve_unmapped（如英文模糊匹配，其候选集只加载一次）。
+        批量处理时应优先使用本方法，而不是逐个 await map_local_to_id。
+        
+        Args:
+            names: 本地疾病名称列表
             
-            if row:
-                disease_id = row[0]
-                
-                # 更新使用统计（异步，不阻塞）
-                try:
-                    await db.execute(text("""
-                        UPDATE disease_mappings
-                        SET usage_count = usage_count + 1,
-                            last_used_at = CURRENT_TIMESTAMP
-                        WHERE country_code = :country
-                          AND local_name = :name
-                    """), {"country": self.country_code, "name": local_name})
-                    await db.commit()
-                except Exception as e:
-                    logger.debug(f"更新使用统计失败: {e}")
-                
-                # 缓存结果
-                self._local_cache[cache_key] = disease_id
-                return disease_id
+        Returns:
+            disease_id 列表，未找到的为 None
+        """
+        mapping = await self._bulk_map_local(list(dict.fromkeys(names)))
+        return [mapping.get(name) for name in names]
+    
+    async def _bulk_map_local(self, names: List[str]) -> Dict[str, Optional[str]]:
+        """
+        批量将本地名称映射为 disease_id（单次查询）
+        
+        查询同时关联标准疾病表，命中的标准信息一并写入缓存，
+        后续 _bulk_standard_info 无需再查数据库。
+        
+        Args:
+            names: 本地疾病名称列表（应已去重）
+            
+        Returns:
+            {本地名称: disease_id 或 None}
+        """
+        mapping: Dict[str, Optional[str]] = {}
+        pending = []
+        for name in names:
+            cache_key = f"{self.country_code}:{name}"
+            if cache_key in self._local_cache:
+                mapping[name] = self._local_cache[cache_key]
             else:
-                # 记录未知疾病
-                await self._record_unknown_disease(local_name)
-                return None
+                pending.append(name)
+        
+        # 已预热时缓存即全集，未命中的名称无需再查数据库
+        found = {}
+        if pending and not self._warmed:
+            async with get_db() as db:
+                result = await db.execute(
+                    _SQL_BULK_MAP_LOCAL,
+                    {"country": self.country_code, "names": pending}
+                )
+                for row in result.fetchall():
+                    local_name, disease_id = row[0], row[1]
+                    found[local_name] = disease_id
+                    if row[2] is not None:
+                        self._standard_cache[disease_id] = DiseaseInfo(*row[1:])
+        
+        for name in pending:
+            if name in found:
+                mapping[name] = found[name]
+                self._local_cache[f"{self.country_code}:{name}"] = found[name]
+            else:
+                mapping[name] = await self._resolve_unmapped(name)
+        
+        await self._count_usage(name for name, disease_id in mapping.items() if disease_id)
+        return mapping
+    
+    async def _count_usage(self, names: Iterable[str]):
+        """累加使用统计，满足间隔或数量条件时批量写回"""
+        self._usage_buffer.update(names)
+        await self._maybe_flush()
+    
+    async def _maybe_flush(self):
+        """缓冲达到数量上限或距上次写回超过间隔时，写回全部缓冲"""
+        if (
+            max(len(self._usage_buffer), len(self._unknown_buffer)) >= STATS_FLUSH_THRESHOLD
+            or time.monotonic() - self._last_flush >= STATS_FLUSH_INTERVAL
+        ):
+            await self.flush()
+    
+    async def flush(self):
+        """
+        将缓冲的使用统计和未知疾病一次性写入数据库
+        
+        缓冲只在后续查询时按数量或间隔触发写回，映射器用完时必须调用一次
+        （或以 ``async with`` 使用映射器），否则剩余的缓冲会丢失。
+        """
+        self._last_flush = time.monotonic()
+        await self.flush_usage()
+        await self.flush_unknown_diseases()
+    
+    async def flush_usage(self):
+        """将缓冲的使用统计一次性写入数据库"""
+        if not self._usage_buffer:
+            return
+        
+        names, counts = zip(*self._usage_buffer.items())
+        self._usage_buffer.clear()
+        
+        try:
+            async with get_db() as db:
+                await db.execute(
+                    _SQL_FLUSH_USAGE,
+                    {"country": self.country_code, "names": list(names), "counts": list(counts)}
+                )
+                await db.commit()
+        except Exception as e:
+            logger.debug(f"更新使用统计失败: {e}")
+    
+    async def _resolve_unmapped(self, local_name: str) -> Optional[str]:
+        """
+        数据库中没有映射时的处理：记录为未知疾病
+        
+        子类可覆盖以提供额外的回退匹配（如英文模糊匹配）
+        """
+        await self._record_unknown_disease(local_name)
+        return None
     
     async def _record_unknown_disease(self, local_name: str):
-        """记录未知疾病到学习建议表"""
+        """记录未知疾病（先缓冲，批量写入学习建议表）"""
+        self._unknown_buffer[local_name] += 1
+        await self._maybe_flush()
+    
+    async def flush_unknown_diseases(self):
+        """将缓冲的未知疾病一次性写入学习建议表"""
+        if not self._unknown_buffer:
+            return
+        
+        names, counts = zip(*self._unknown_buffer.items())
+        self._unknown_buffer.clear()
+        
         try:
             async with get_db() as db:
-                await db.execute(text("""
-                    INSERT INTO disease_learning_suggestions (
-                        country_code, local_name,
-                        occurrence_count, first_seen_at, last_seen_at
-                    ) VALUES (
-                        :country, :name, 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-                    )
-                    ON CONFLICT (country_code, local_name) DO UPDATE SET
-                        occurrence_count = disease_learning_suggestions.occurrence_count + 1,
-                        last_seen_at = CURRENT_TIMESTAMP
-                """), {"country": self.country_code, "name": local_name})
+                await db.execute(
+                    _SQL_FLUSH_UNKNOWN,
+                    {"country": self.country_code, "names": list(names), "counts": list(counts)}
+                )
                 await db.commit()
         except Exception as e:
             logger.debug(f"记录未知疾病失败: {e}")
@@ -131,12 +358,7 @@ class DiseaseMapperDB:
         
         async with get_db() as db:
             result = await db.execute(
-                text("""
-                    SELECT disease_id, standard_name_en, standard_name_zh,
-                           category, icd_10, icd_11, description
-                    FROM standard_diseases
-                    WHERE disease_id = :did AND is_active = true
-                """),
+                _SQL_STANDARD_INFO,
                 {"did": disease_id}
             )
             row = result.fetchone()
@@ -158,6 +380,35 @@ class DiseaseMapperDB:
             
             return None
     
+    async def _bulk_standard_info(self, disease_ids: List[str]) -> Dict[str, DiseaseInfo]:
+        """
+        批量获取标准疾病信息（单次查询）
+        
+        Args:
+            disease_ids: 疾病ID列表（应已去重）
+            
+        Returns:
+            {disease_id: DiseaseInfo}，未找到的ID不包含在内
+        """
+        infos = {did: self._standard_cache[did] for did in disease_ids if did in self._standard_cache}
+        pending = [did for did in disease_ids if did not in infos]
+        
+        if not pending:
+            return infos
+        
+        async with get_db() as db:
+            result = await db.execute(
+                _SQL_BULK_STANDARD_INFO,
+                {"ids": pending}
+            )
+            
+            for row in result.fetchall():
+                info = DiseaseInfo(*row)
+                self._standard_cache[info.disease_id] = info
+                infos[info.disease_id] = info
+        
+        return infos
+    
     async def get_standard_name(
         self,
         disease_id: str,
@@ -183,7 +434,8 @@ class DiseaseMapperDB:
         df: pd.DataFrame,
         disease_col: str = "disease_name",
         add_id_col: bool = True,
-        add_standard_name: bool = True
+        add_standard_name: bool = True,
+        copy: bool = True
     ) -> pd.DataFrame:
         """
         批量映射DataFrame
@@ -193,37 +445,28 @@ class DiseaseMapperDB:
             disease_col: 疾病名称列
             add_id_col: 是否添加disease_id列
             add_standard_name: 是否添加标准名称列
+            copy: 是否在副本上添加列；为False时直接修改传入的数据框，避免整表复制
             
         Returns:
             处理后的数据框
         """
-        result_df = df.copy()
+        result_df = df.copy() if copy else df
         
         if add_id_col:
-            # 批量查询映射
-            unique_diseases = result_df[disease_col].dropna().unique()
-            
-            # 构建映射字典
-            disease_to_id = {}
-            for disease_name in unique_diseases:
-                disease_id = await self.map_local_to_id(disease_name)
-                disease_to_id[disease_name] = disease_id
+            # 批量查询映射（单次查询）
+            unique_diseases = result_df[disease_col].dropna().unique().tolist()
+            disease_to_id = await self._bulk_map_local(unique_diseases)
             
             # 应用映射
             result_df['disease_id'] = result_df[disease_col].map(disease_to_id)
         
         if add_standard_name:
-            # 批量查询标准名称
-            unique_ids = result_df['disease_id'].dropna().unique()
-            
-            id_to_name_en = {}
-            id_to_name_zh = {}
+            # 批量获取标准名称（通常已由映射查询写入缓存）
+            unique_ids = result_df['disease_id'].dropna().unique().tolist()
+            infos = await self._bulk_standard_info(unique_ids)
             
-            for disease_id in unique_ids:
-                info = await self.get_standard_info(disease_id)
-                if info:
-                    id_to_name_en[disease_id] = info.standard_name_en
-                    id_to_name_zh[disease_id] = info.standard_name_zh
+            id_to_name_en = {did: info.standard_name_en for did, info in infos.items()}
+            id_to_name_zh = {did: info.standard_name_zh for did, info in infos.items()}
             
             result_df['standard_name_en'] = result_df['disease_id'].map(id_to_name_en)
             result_df['standard_name_zh'] = result_df['disease_id'].map(id_to_name_zh)
@@ -329,15 +572,17 @@ class DiseaseMapperDB:
             
             record_id = result.scalar_one()
             
-            # 清除缓存
+            # 更新缓存
             cache_key = f"{self.country_code}:{local_name}"
-            self._local_cache.pop(cache_key, None)
+            self._local_cache[cache_key] = disease_id
             
             logger.info(f"✅ 映射添加成功: {local_name} → {disease_id}")
             return record_id
     
     async def get_statistics(self) -> Dict:
         """获取统计信息"""
+        await self.flush_unknown_diseases()
+        
         async with get_db() as db:
             # 标准疾病数
             result = await db.execute(
@@ -391,6 +636,8 @@ class DiseaseMapperDB:
     
     async def get_unknown_diseases(self, limit: int = 20) -> List[Dict]:
         """获取未知疾病列表"""
+        await self.flush_unknown_diseases()
+        
         async with get_db() as db:
             result = await db.execute(
                 text("""
@@ -425,12 +672,37 @@ class DiseaseMapperDB:
         """清除内存缓存"""
         self._local_cache.clear()
         self._standard_cache.clear()
+        self._warmed = False
         logger.info("🗑️  缓存已清除")
 
 
+# 同步包装器共用的后台事件循环（首次使用时启动，常驻守护线程）
+_SYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SYNC_LOOP_LOCK = threading.Lock()
+
+
+def _run_sync(coro: Coroutine):
+    """在常驻后台事件循环中执行协程并等待结果（复用同一循环，数据库连接池保持可用）"""
+    global _SYNC_LOOP
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None:
+            _SYNC_LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_SYNC_LOOP.run_forever,
+                name="DiseaseMapperDB-EventLoop",
+                daemon=True,
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _SYNC_LOOP).result()
+
+
 # 兼容接口：支持同步调用（用于Data Processor）
 class DiseaseMapperDBSync:
-    """同步包装器（用于兼容现有代码）"""
+    """
+    同步包装器（用于兼容现有代码）
+    
+    使用统计和未知疾病在内存中缓冲，用完后必须调用 flush()/close()
+    （或以 ``with`` 使用），否则剩余的缓冲会丢失。
+    """
     
     def __init__(self, country_code: str):
         self.mapper = DiseaseMapperDB(country_code)
@@ -438,25 +710,23 @@ class DiseaseMapperDBSync:
     
     def map_local_to_id(self, local_name: str) -> Optional[str]:
         """同步版本"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        return _run_sync(self.mapper.map_local_to_id(local_name))
+    
+    def map_many(self, names: List[str]) -> List[Optional[str]]:
+        """
+        批量映射（单次查询），结果与输入顺序一致
         
-        return loop.run_until_complete(self.mapper.map_local_to_id(local_name))
+        Args:
+            names: 本地疾病名称列表
+            
+        Returns:
+            disease_id 列表，未找到的为 None
+        """
+        return _run_sync(self.mapper.batch_map_local_to_id(names))
     
     def get_standard_name(self, disease_id: str, lang: str = "en") -> Optional[str]:
         """同步版本"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.mapper.get_standard_name(disease_id, lang))
+        return _run_sync(self.mapper.get_standard_name(disease_id, lang))
     
     def map_dataframe(
         self,
@@ -465,13 +735,18 @@ class DiseaseMapperDBSync:
         add_id_col: bool = True
     ) -> pd.DataFrame:
         """同步版本"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(
-            self.mapper.map_dataframe(df, disease_col, add_id_col)
-        )
+        return _run_sync(self.mapper.map_dataframe(df, disease_col, add_id_col))
+    
+    def flush(self):
+        """将缓冲的使用统计和未知疾病写入数据库"""
+        return _run_sync(self.mapper.flush())
+    
+    def close(self):
+        """写回缓冲（映射器之后仍可继续使用）"""
+        self.flush()
+    
+    def __enter__(self) -> "DiseaseMapperDBSync":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
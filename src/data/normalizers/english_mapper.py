@@ -3,18 +3,175 @@ GlobalID V2 Multi-Language Disease Mapper
 
 支持多国多语言的疾病名称映射系统
 """
+from collections import OrderedDict
 from typing import Optional, Dict, List, Tuple
 from sqlalchemy import text, func
 from enum import Enum
+from functools import lru_cache
 import re
 from difflib import SequenceMatcher
 
+# rapidfuzz 为可选依赖（C++ 实现），未安装时回退到 difflib
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
 from .disease_mapper_db import DiseaseMapperDB
 from src.core.database import get_db
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 模糊匹配结果缓存的最大条目数（超出后淘汰最久未使用的）
+FUZZY_CACHE_SIZE = 1024
+
+# 有效匹配的最低相似度（短词要求更高，见 _is_valid_match）
+_MIN_SIMILARITY = 0.85
+
+# 候选名称比输入多出这些词时视为更具体的疾病（如 "Hepatitis" 不匹配 "Hepatitis A"）
+_SPECIFIC_INDICATORS = frozenset({'a', 'b', 'c', 'd', 'e', 'type', '1', '2', '3', 'acute', 'chronic'})
+
+# 模糊匹配前去除非字母字符：ASCII名称用 bytes.translate 删除字符，其余回退到正则
+_NON_ALPHA = re.compile(r'[^a-zA-Z\s]')
+_NON_ALPHA_ASCII = bytes(i for i in range(128) if not (chr(i).isalpha() or chr(i).isspace()))
+
+# 所有 *_EN 英文映射（候选集在每个映射器实例中只加载一次）
+# 多个国家的英文映射常有重复行，在数据库端去重以减少传输和建树的行数
+_SQL_EN_CANDIDATES = text("""
+    SELECT dm.disease_id, dm.local_name,
+           COALESCE(sd.standard_name_en, '') AS standard_name_en, dm.priority
+    FROM disease_mappings dm
+    JOIN standard_diseases sd ON dm.disease_id = sd.disease_id
+    WHERE dm.country_code LIKE :country_pattern
+      AND dm.is_active = true
+    GROUP BY dm.disease_id, dm.local_name, sd.standard_name_en, dm.priority
+    ORDER BY dm.priority DESC, MAX(dm.confidence_score) DESC
+""")
+
+
+@lru_cache(maxsize=4096)
+def _normalize(name: str) -> str:
+    """小写并去除非字母字符，用于模糊匹配比较"""
+    name = name.lower().strip()
+    if name.isascii():
+        return name.encode('ascii').translate(None, _NON_ALPHA_ASCII).decode('ascii')
+    return _NON_ALPHA.sub('', name)
+
+
+def _max_edit_distance(length: int, threshold: float = _MIN_SIMILARITY) -> int:
+    """
+    相似度不低于 threshold 的名称与长度为 length 的查询之间的最大插入删除距离
+    
+    相似度 ≤ 1 - 插入删除距离 / (两串长度之和)（rapidfuzz 取等号，difflib 不超过它），
+    据此推出候选长度上限和距离上限，用于在字典树中剪枝（不会漏掉有效匹配）。
+    """
+    return int(2 * (1 - threshold) * length / threshold + 1e-9)
+
+
+class _TrieNode:
+    """候选名称字典树节点"""
+    
+    __slots__ = ('children', 'entries')
+    
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.entries: List[Tuple[int, int]] = []  # 以此结尾的 (候选序号, 0=本地名称/1=标准名称)
+
+
+def _build_trie(names: List[Tuple[str, str]]) -> _TrieNode:
+    """由 [(规范化本地名称, 规范化标准名称)] 构建字典树"""
+    root = _TrieNode()
+    for index, pair in enumerate(names):
+        for kind, name in enumerate(pair):
+            node = root
+            for letter in name:
+                child = node.children.get(letter)
+                if child is None:
+                    child = node.children[letter] = _TrieNode()
+                node = child
+            node.entries.append((index, kind))
+    return root
+
+
+class _LevenshteinAutomaton:
+    """
+    编辑距离不超过 max_cost 的 Levenshtein 自动机
+    
+    状态是编辑距离矩阵一行中不超过 max_cost 的稀疏部分 (位置元组, 距离元组)，
+    超出 max_cost 的位置直接丢弃，状态为空即死状态。
+    substitution_cost=2 时即插入删除距离（替换等价于一次删除加一次插入）。
+    """
+    
+    __slots__ = ('word', 'max_cost', 'substitution_cost')
+    
+    def __init__(self, word: str, max_cost: int, substitution_cost: int = 1):
+        self.word = word
+        self.max_cost = max_cost
+        self.substitution_cost = substitution_cost
+    
+    def start(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        positions = tuple(range(min(self.max_cost, len(self.word)) + 1))
+        return positions, positions
+    
+    def step(self, state: Tuple[Tuple[int, ...], Tuple[int, ...]], letter: str) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        positions, costs = state
+        word, max_cost = self.word, self.max_cost
+        new_positions: List[int] = []
+        new_costs: List[int] = []
+        if positions and positions[0] == 0 and costs[0] < max_cost:
+            new_positions.append(0)
+            new_costs.append(costs[0] + 1)
+        for j, i in enumerate(positions):
+            if i == len(word):
+                break
+            cost = costs[j] + (self.substitution_cost if word[i] != letter else 0)
+            if new_positions and new_positions[-1] == i:
+                cost = min(cost, new_costs[-1] + 1)
+            if j + 1 < len(positions) and positions[j + 1] == i + 1:
+                cost = min(cost, costs[j + 1] + 1)
+            if cost <= max_cost:
+                new_positions.append(i + 1)
+                new_costs.append(cost)
+        
+        return tuple(new_positions), tuple(new_costs)
+    
+    def is_match(self, state: Tuple[Tuple[int, ...], Tuple[int, ...]]) -> bool:
+        return bool(state[0]) and state[0][-1] == len(self.word)
+    
+    def can_match(self, state: Tuple[Tuple[int, ...], Tuple[int, ...]]) -> bool:
+        return bool(state[0])
+
+
+def _search_trie(root: _TrieNode, word: str, threshold: float = _MIN_SIMILARITY) -> List[Tuple[int, int]]:
+    """
+    查找字典树中可能与 word 相似度不低于 threshold 的所有名称
+    
+    字典树与插入删除距离自动机同步遍历，自动机进入死状态时剪掉整棵子树；
+    到达名称结尾时再按该名称的实际长度收紧距离上限。
+    比 Levenshtein 距离剪枝更早（替换计为2），且同样不会漏掉有效匹配。
+    """
+    slack = 1 - threshold
+    automaton = _LevenshteinAutomaton(word, _max_edit_distance(len(word), threshold), substitution_cost=2)
+    start = automaton.start()
+    results = list(root.entries) if automaton.is_match(start) else []
+    
+    stack = [(root, start, 0)]
+    while stack:
+        node, state, depth = stack.pop()
+        depth += 1
+        for letter, child in node.children.items():
+            next_state = automaton.step(state, letter)
+            if not automaton.can_match(next_state):
+                continue
+            if (child.entries and automaton.is_match(next_state)
+                    and next_state[1][-1] <= int(slack * (len(word) + depth) + 1e-9)):
+                results.extend(child.entries)
+            if child.children:
+                stack.append((child, next_state, depth))
+    
+    return results
+
 
 class MultiLanguageDiseaseMapper(DiseaseMapperDB):
     """多国多语言疾病映射器基类"""
@@ -49,115 +206,176 @@ class EnglishDiseaseMapper(MultiLanguageDiseaseMapper):
     def __init__(self, country_code: str = "CN"):
         # 英文映射器使用英语
         super().__init__(country_code=country_code, language_code="en")
+        # 模糊匹配候选: (disease_id, local_name, 规范化local_name, standard_name, 规范化standard_name, priority)
+        self._candidates_cache: Optional[List[Tuple[str, str, str, str, str, int]]] = None
+        self._candidate_trie: Optional[_TrieNode] = None
+        # 规范化候选名称 -> 词集合（加载时预先切分）
+        self._token_sets: Dict[str, frozenset] = {}
+        # 规范化名称 -> (disease_id, 原始名称)，精确命中时无需相似度计算
+        self._exact_map: Dict[str, Tuple[str, str]] = {}
+        # 模糊匹配结果: 规范化名称 -> disease_id（未匹配时为None）
+        self._fuzzy_result_cache: OrderedDict[str, Optional[str]] = OrderedDict()
         logger.info(f"English disease mapper initialized for {country_code} (loading from database)")
     
     def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """计算两个字符串的相似度"""
-        return SequenceMatcher(None, text1.lower().strip(), text2.lower().strip()).ratio()
+        """计算两个已规范化（见 _normalize）字符串的相似度（0~1）"""
+        if fuzz is not None:
+            return fuzz.ratio(text1, text2) / 100.0
+        return SequenceMatcher(None, text1, text2).ratio()
     
-    def _is_valid_match(self, input_name: str, candidate_name: str, threshold: float = 0.85) -> bool:
+    def _batch_similarity(self, text: str, choices: List[str]) -> List[float]:
+        """
+        计算一个已规范化字符串与多个候选的相似度（0~1）
+        
+        安装了 rapidfuzz 时用 process.cdist 一次计算全部候选，
+        低于最低阈值的得分记为0（这些候选本就无效）。
+        """
+        if process is not None and choices:
+            scores = process.cdist([text], choices, scorer=fuzz.ratio, score_cutoff=_MIN_SIMILARITY * 100)
+            return [score / 100.0 for score in scores[0].tolist()]
+        return [self._calculate_similarity(text, choice) for choice in choices]
+    
+    def _is_valid_match(
+        self,
+        input_clean: str,
+        candidate_clean: str,
+        threshold: float = 0.85,
+        similarity: Optional[float] = None,
+    ) -> Tuple[bool, float]:
         """
         验证是否为有效匹配，避免错误的模糊匹配
         
         Args:
-            input_name: 输入的疾病名称
-            candidate_name: 候选匹配名称
+            input_clean: 规范化后的输入疾病名称
+            candidate_clean: 规范化后的候选匹配名称
             threshold: 相似度阈值
+            similarity: 已批量计算的相似度（为None时在此计算）
+            
+        Returns:
+            (是否有效, 相似度)，调用方可直接复用相似度排序
         """
-        input_clean = re.sub(r'[^a-zA-Z\s]', '', input_name.lower().strip())
-        candidate_clean = re.sub(r'[^a-zA-Z\s]', '', candidate_name.lower().strip())
-        
         # 完全匹配
         if input_clean == candidate_clean:
-            return True
+            return True, 1.0
             
         # 计算相似度
-        similarity = self._calculate_similarity(input_clean, candidate_clean)
+        if similarity is None:
+            similarity = self._calculate_similarity(input_clean, candidate_clean)
         
         # 对于短词，要求更高的匹配度
         if len(input_clean) <= 10:
             threshold = 0.90
         
+        # 相似度不足时无需再检查词集合
+        if similarity < threshold:
+            return False, similarity
+        
         # 避免部分匹配错误：如 "Hepatitis" 不应匹配到 "Hepatitis A"
         # 如果输入词是候选词的一部分，但候选词明显更具体，则不匹配
-        input_words = set(input_clean.split())
-        candidate_words = set(candidate_clean.split())
+        input_words = self._token_sets.get(input_clean) or frozenset(input_clean.split())
+        candidate_words = self._token_sets.get(candidate_clean) or frozenset(candidate_clean.split())
         
-        # 如果输入词完全包含在候选词中，但候选词有额外的特定标识符
-        if (input_words.issubset(candidate_words) and 
-            len(candidate_words) > len(input_words)):
-            
-            # 检查是否有特定的类型标识符（如A, B, C等）
-            extra_words = candidate_words - input_words
-            specific_indicators = {'a', 'b', 'c', 'd', 'e', 'type', '1', '2', '3', 'acute', 'chronic'}
-            
-            if extra_words.intersection(specific_indicators):
-                logger.debug(f"Rejected specific match: '{input_name}' -> '{candidate_name}' (too specific)")
-                return False
+        # 如果输入词完全包含在候选词中，但候选词有额外的特定标识符（如A, B, C等）
+        if len(candidate_words) > len(input_words) and input_words <= candidate_words:
+            if any(word in _SPECIFIC_INDICATORS for word in candidate_words - input_words):
+                logger.debug(f"Rejected specific match: '{input_clean}' -> '{candidate_clean}' (too specific)")
+                return False, similarity
         
-        return similarity >= threshold
+        return True, similarity
+    
+    async def _load_candidates(self) -> List[Tuple[str, str, str, str, str, int]]:
+        """
+        加载并规范化所有英文映射候选（仅首次查询访问数据库，之后复用）
+        """
+        if self._candidates_cache is None:
+            async with get_db() as db:
+                result = await db.execute(_SQL_EN_CANDIDATES, {
+                    "country_pattern": "%_EN"  # 匹配所有 *_EN 格式的英文映射
+                })
+                rows = result.fetchall()
+            
+            self._candidates_cache = [
+                (disease_id, local_name, _normalize(local_name),
+                 standard_name, _normalize(standard_name), priority)
+                for disease_id, local_name, standard_name, priority in rows
+            ]
+            self._candidate_trie = _build_trie([(c[2], c[4]) for c in self._candidates_cache])
+            # 候选已按优先级降序排列，同名时保留第一个（与模糊匹配的排序结果一致）
+            self._exact_map = {}
+            self._token_sets = {}
+            for disease_id, local_name, norm_local, standard_name, norm_standard, _ in self._candidates_cache:
+                self._token_sets[norm_local] = frozenset(norm_local.split())
+                self._token_sets[norm_standard] = frozenset(norm_standard.split())
+                self._exact_map.setdefault(norm_local, (disease_id, local_name))
+                self._exact_map.setdefault(norm_standard, (disease_id, standard_name))
+            logger.debug(f"Loaded {len(self._candidates_cache)} English fuzzy-match candidates")
+        return self._candidates_cache
     
     async def fuzzy_match_english(self, disease_name: str) -> Optional[str]:
         """
         改进的模糊匹配英文疾病名称
+        
+        输入只规范化一次，候选名称在加载时已规范化；结果按规范化名称缓存，
+        批量数据中重复的名称只匹配一次
         """
+        norm_name = _normalize(disease_name)
+        if norm_name in self._fuzzy_result_cache:
+            self._fuzzy_result_cache.move_to_end(norm_name)
+            return self._fuzzy_result_cache[norm_name]
+        
         try:
-            async with get_db() as db:
-                # 获取所有英文映射进行智能匹配
-                result = await db.execute(text("""
-                    SELECT dm.disease_id, dm.local_name, dm.confidence_score,
-                           sd.standard_name_en, dm.priority
-                    FROM disease_mappings dm
-                    JOIN standard_diseases sd ON dm.disease_id = sd.disease_id
-                    WHERE dm.country_code LIKE :country_pattern
-                      AND dm.is_active = true
-                    ORDER BY dm.priority DESC, dm.confidence_score DESC
-                """), {
-                    "country_pattern": f"%_EN"  # 匹配所有 *_EN 格式的英文映射
-                })
-                
-                candidates = result.fetchall()
-                valid_matches = []
-                
-                # 为每个候选项计算匹配度
-                for candidate in candidates:
-                    disease_id, local_name, confidence, standard_name, priority = candidate
-                    
-                    # 检查与本地名称的匹配
-                    if self._is_valid_match(disease_name, local_name):
-                        similarity = self._calculate_similarity(disease_name, local_name)
-                        valid_matches.append((disease_id, local_name, similarity, priority, 'local'))
-                    
-                    # 检查与标准名称的匹配
-                    if self._is_valid_match(disease_name, standard_name):
-                        similarity = self._calculate_similarity(disease_name, standard_name)
-                        valid_matches.append((disease_id, standard_name, similarity, priority, 'standard'))
-                
-                if valid_matches:
-                    # 按相似度和优先级排序
-                    valid_matches.sort(key=lambda x: (x[2], x[3]), reverse=True)
-                    best_match = valid_matches[0]
-                    
-                    logger.info(f"Smart matched '{disease_name}' to '{best_match[1]}' ({best_match[0]}, similarity: {best_match[2]:.2f})")
-                    return best_match[0]
+            candidates = await self._load_candidates()
+            
+            # 规范化名称精确命中，直接返回
+            exact = self._exact_map.get(norm_name)
+            if exact is not None:
+                logger.info(f"Smart matched '{disease_name}' to '{exact[1]}' ({exact[0]}, similarity: 1.00)")
+                return exact[0]
+            
+            valid_matches = []
+            # 字典树预筛选：只有插入删除距离足够小的名称才可能达到相似度阈值
+            hits = _search_trie(self._candidate_trie, norm_name)
+            
+            # 一次批量计算所有候选的相似度（按候选顺序，本地名称在前）
+            hits.sort()
+            hit_names = [candidates[index][4 if kind else 2] for index, kind in hits]
+            scores = self._batch_similarity(norm_name, hit_names)
+            
+            for (index, kind), candidate_norm, score in zip(hits, hit_names, scores):
+                disease_id, local_name, _, standard_name, _, priority = candidates[index]
+                candidate_name = standard_name if kind else local_name
+                is_valid, similarity = self._is_valid_match(norm_name, candidate_norm, similarity=score)
+                if is_valid:
+                    valid_matches.append((disease_id, candidate_name, similarity, priority, 'standard' if kind else 'local'))
+            
+            if valid_matches:
+                # 按相似度和优先级排序
+                valid_matches.sort(key=lambda x: (x[2], x[3]), reverse=True)
+                best_match = valid_matches[0]
                 
+                logger.info(f"Smart matched '{disease_name}' to '{best_match[1]}' ({best_match[0]}, similarity: {best_match[2]:.2f})")
+                match = best_match[0]
+            else:
                 logger.debug(f"No valid fuzzy match found for '{disease_name}'")
-                return None
-                
+                match = None
+            
         except Exception as e:
             logger.error(f"Fuzzy matching failed: {e}")
             return None
+        
+        self._fuzzy_result_cache[norm_name] = match
+        if len(self._fuzzy_result_cache) > FUZZY_CACHE_SIZE:
+            self._fuzzy_result_cache.popitem(last=False)
+        return match
     
-    async def map_local_to_id(self, local_name: str) -> Optional[str]:
+    async def _resolve_unmapped(self, local_name: str) -> Optional[str]:
         """
-        重写映射方法，增加英文特定的处理逻辑
+        重写未命中处理，增加英文特定的处理逻辑
         """
-        # 先尝试标准映射
-        result = await super().map_local_to_id(local_name)
-        if result:
-            return result
+        # 记录未知疾病
+        await super()._resolve_unmapped(local_name)
         
-        # 如果标准映射失败，尝试模糊匹配
+        # 标准映射失败，尝试模糊匹配
         return await self.fuzzy_match_english(local_name)
     
     async def get_statistics(self) -> Dict[str, int]:
@@ -165,6 +383,21 @@ class EnglishDiseaseMapper(MultiLanguageDiseaseMapper):
         stats = await super().get_statistics()
         stats['mapper_type'] = 'English'
         return stats
+    
+    async def add_mapping(self, disease_id: str, local_name: str, **kwargs) -> int:
+        """添加映射后使模糊匹配候选和结果缓存失效"""
+        record_id = await super().add_mapping(disease_id, local_name, **kwargs)
+        self._candidates_cache = None
+        self._candidate_trie = None
+        self._fuzzy_result_cache.clear()
+        return record_id
+    
+    def clear_cache(self):
+        """清除内存缓存（包括模糊匹配候选和结果）"""
+        super().clear_cache()
+        self._candidates_cache = None
+        self._candidate_trie = None
+        self._fuzzy_result_cache.clear()
 
 
 # 支持的国家和语言配置
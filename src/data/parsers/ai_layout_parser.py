@@ -12,9 +12,27 @@ from __future__ import annotations
 
 import os
 import base64
+import json
 import mimetypes
+import tempfile
 import requests
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Dict, Any, List, Tuple
+
+# httpx with HTTP/2 support is optional; it multiplexes the API call and all image
+# downloads over one connection. Falls back to a pooled requests session.
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for http2=True)
+except ImportError:
+    httpx = None
+
+# Raw bytes read per step while base64-encoding the upload (multiple of 3, so no padding mid-stream)
+UPLOAD_CHUNK_SIZE = 3 * 256 * 1024
+
+# Images are fetched concurrently; one pooled connection per worker
+MAX_IMAGE_WORKERS = 16
 
 
 class AiLayoutParser:
@@ -24,6 +42,18 @@ class AiLayoutParser:
         self.token = token or os.getenv("AI_LAYOUT_TOKEN")
         if not self.token:
             raise ValueError("AI_LAYOUT_TOKEN not provided (env var AI_LAYOUT_TOKEN or token parameter)")
+        # One client for the API call and image downloads (keep-alive, pooled TLS)
+        if httpx is not None:
+            self.session = httpx.Client(
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+        else:
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_IMAGE_WORKERS)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
 
     def _file_type_from_path(self, path: str) -> int:
         # 0 = PDF, 1 = image
@@ -32,6 +62,49 @@ class AiLayoutParser:
             return 0
         return 1
 
+    def _write_json_body(self, file_path: str, out, fields: Dict[str, Any]) -> None:
+        """Write {"file": <base64 of file_path>, **fields} as JSON to out, encoding chunk by chunk."""
+        out.write(b'{"file": "')
+        with open(file_path, 'rb') as f:
+            while chunk := f.read(UPLOAD_CHUNK_SIZE):
+                out.write(base64.b64encode(chunk))
+        out.write(b'"')
+        for key, value in fields.items():
+            out.write(f', {json.dumps(key)}: {json.dumps(value)}'.encode('utf-8'))
+        out.write(b'}')
+
+    def _post_body(self, body, headers: Dict[str, str]):
+        """POST the prepared JSON body file to the API, streaming it with a known Content-Length."""
+        size = body.tell()
+        body.seek(0)
+        if httpx is not None:
+            chunks = iter(partial(body.read, UPLOAD_CHUNK_SIZE), b'')
+            return self.session.post(self.api_url, content=chunks, headers={**headers, "Content-Length": str(size)}, timeout=120)
+        return self.session.post(self.api_url, data=body, headers=headers, timeout=120)
+
+    def _fetch_image(self, url: str):
+        try:
+            return self.session.get(url, timeout=30)
+        except Exception:
+            # skip failing images
+            return None
+
+    def _download_images(self, downloads: List[Tuple[str, str, bool]]) -> None:
+        """Fetch (url, path, require_ok) entries concurrently, then write them to disk."""
+        if not downloads:
+            return
+        with ThreadPoolExecutor(max_workers=min(MAX_IMAGE_WORKERS, len(downloads))) as pool:
+            responses = list(pool.map(self._fetch_image, [url for url, _, _ in downloads]))
+
+        for (_, path, require_ok), r in zip(downloads, responses):
+            if r is None or (require_ok and r.status_code != 200):
+                continue
+            try:
+                with open(path, 'wb') as f:
+                    f.write(r.content)
+            except Exception:
+                pass
+
     def parse_file(self, file_path: str, out_dir: Optional[str] = None, extra_opts: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Send file to layout-parsing API and save results.
 
@@ -41,23 +114,20 @@ class AiLayoutParser:
         if not os.path.isfile(file_path):
             raise FileNotFoundError(file_path)
 
-        with open(file_path, 'rb') as f:
-            b = f.read()
-
-        file_b64 = base64.b64encode(b).decode('ascii')
-        payload = {
-            "file": file_b64,
-            "fileType": self._file_type_from_path(file_path),
-        }
+        # The file is base64-encoded straight into a temporary file that is streamed
+        # as the request body, so the whole file is never held in memory
+        fields = {"fileType": self._file_type_from_path(file_path)}
         # merge optional flags
-        payload.update(extra_opts)
+        fields.update((k, v) for k, v in extra_opts.items() if k != "file")
 
         headers = {
             "Authorization": f"token {self.token}",
             "Content-Type": "application/json",
         }
 
-        resp = requests.post(self.api_url, json=payload, headers=headers, timeout=120)
+        with tempfile.TemporaryFile() as body:
+            self._write_json_body(file_path, body, fields)
+            resp = self._post_body(body, headers)
         resp.raise_for_status()
         data = resp.json()
 
@@ -66,6 +136,8 @@ class AiLayoutParser:
         os.makedirs(out_dir, exist_ok=True)
 
         markdown_texts = []
+        downloads = []  # (url, path, require_ok)
+        created_dirs = {out_dir}  # create each image directory once
         # save layoutParsingResults -> markdown + images
         for i, res in enumerate(result.get('layoutParsingResults', []) or []):
             md = res.get('markdown', {}).get('text', '')
@@ -77,26 +149,18 @@ class AiLayoutParser:
             # markdown images: keys are local paths, values are urls
             for img_path, img_url in (res.get('markdown', {}).get('images') or {}).items():
                 full_img_path = os.path.join(out_dir, img_path)
-                os.makedirs(os.path.dirname(full_img_path), exist_ok=True)
+                img_dir = os.path.dirname(full_img_path)
+                if img_dir not in created_dirs:
+                    os.makedirs(img_dir, exist_ok=True)
+                    created_dirs.add(img_dir)
                 # img_url may be a web URL; fetch it
-                try:
-                    img_bytes = requests.get(img_url, timeout=30).content
-                    with open(full_img_path, 'wb') as imf:
-                        imf.write(img_bytes)
-                except Exception:
-                    # skip failing images
-                    pass
+                downloads.append((img_url, full_img_path, False))
 
         # save any outputImages
         for img_name, img_url in (result.get('outputImages') or {}).items():
-            try:
-                r = requests.get(img_url, timeout=30)
-                if r.status_code == 200:
-                    fname = os.path.join(out_dir, f"{img_name}.jpg")
-                    with open(fname, 'wb') as f:
-                        f.write(r.content)
-            except Exception:
-                pass
+            downloads.append((img_url, os.path.join(out_dir, f"{img_name}.jpg"), True))
+
+        self._download_images(downloads)
 
         return {"status": resp.status_code, "result": result, "markdowns": markdown_texts, "out_dir": out_dir}
 
@@ -16,6 +16,9 @@ from .base import BaseParser, ParseResult
 
 logger = get_logger(__name__)
 
+# 疾病名称中需要去除的字符：除字母数字（含中文）、空白以外的全部字符，以及下划线
+_CN_STRIP_RE = re.compile(r'[^\w\s\u4e00-\u9fff]|_')
+
 
 class HTMLTableParser(BaseParser):
     """
@@ -289,14 +292,14 @@ class HTMLTableParser(BaseParser):
         data = data[~data["DiseasesCN"].str.contains("合计", na=False)]
         
         # 清洗疾病名称 - 只保留中文字符、字母、数字、空格
-        # 使用Unicode范围匹配中文: \u4e00-\u9fff
-        data["DiseasesCN"] = data["DiseasesCN"].apply(
-            lambda x: ''.join(c for c in str(x) if c.isalnum() or c.isspace() or '\u4e00' <= c <= '\u9fff')
-        )
-        data["DiseasesCN"] = data["DiseasesCN"].str.replace(
-            "甲乙丙类总计", "合计", regex=False
+        # 使用Unicode范围匹配中文: \u4e00-\u9fff；整列一次正则替换，而非逐字符判断
+        data["DiseasesCN"] = (
+            data["DiseasesCN"]
+            .map(str)
+            .str.replace(_CN_STRIP_RE, "", regex=True)
+            .str.replace("甲乙丙类总计", "合计", regex=False)
+            .str.strip()
         )
-        data["DiseasesCN"] = data["DiseasesCN"].str.strip()
         
         # 添加额外的列
         data["DOI"] = metadata.get("doi", "missing")
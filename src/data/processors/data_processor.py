@@ -110,12 +110,12 @@ class DataProcessor:
         # Display statistics
         try:
             if processed_data:
-                # Use the last mapper's statistics
-                default_mapper = await create_disease_mapper(
+                # 各报告的映射器已在处理结束时写回未知疾病，这里读取的是数据库中的汇总
+                async with await create_disease_mapper(
                     country_code=self.country_code or "CN",
                     language="zh"
-                )
-                stats = await default_mapper.get_statistics()
+                ) as default_mapper:
+                    stats = await default_mapper.get_statistics()
                 pending_count = stats.get('pending_suggestions', 0)
                 if pending_count > 0:
                     logger.warning(f"Found {pending_count} unrecognized disease(s), run: python scripts/disease_cli.py suggestions")
@@ -274,10 +274,14 @@ class DataProcessor:
         # 使用数据库映射器: 本地名称 -> 标准英文名 + disease_id
         source_col = "DiseasesCN" if language == "zh" else "Diseases"
         
-        df = await disease_mapper.map_dataframe(
-            df,
-            disease_col=source_col,
-        )
+        try:
+            df = await disease_mapper.map_dataframe(
+                df,
+                disease_col=source_col,
+            )
+        finally:
+            # 映射器按报告创建，用完即弃：写回缓冲的使用统计和未知疾病
+            await disease_mapper.flush()
         
         logger.debug(f"map_dataframe returned shape: {df.shape}")
         
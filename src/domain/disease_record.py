@@ -75,6 +75,12 @@ class DiseaseRecord(Base):
         Index("idx_record_country", "country_id"),
         Index("idx_record_region", "region"),
         Index("idx_record_time_disease_country", "time", "disease_id", "country_id"),
+        # 覆盖索引：质量检查按国家聚合时可走 index-only scan
+        Index(
+            "idx_record_country_covering",
+            "country_id",
+            postgresql_include=["cases", "deaths", "time", "data_source"],
+        ),
     )
     
     def __repr__(self) -> str:
@@ -8,7 +8,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Optional, List
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, JSON, String, Text, Boolean
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, JSON, String, Text, Boolean, desc
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -152,6 +152,8 @@ class Task(BaseModel):
         Index("idx_task_report", "report_id"),
         Index("idx_task_parent", "parent_task_id"),
         Index("idx_task_created", "created_at"),
+        # Per-type listing ordered by newest first (e.g. crawler task view)
+        Index("idx_task_type_created", "task_type", desc("created_at")),
     )
     
     def __repr__(self) -> str:
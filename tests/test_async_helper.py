@@ -0,0 +1,60 @@
+"""
+测试 Dashboard 异步辅助工具
+
+验证 async_cached 的缓存键与 LRU 淘汰行为
+"""
+import sys
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.dashboard.common.async_helper import async_cached, run_async
+
+
+def test_run_async_returns_result():
+    """测试后台事件循环执行协程"""
+    async def add(a, b):
+        return a + b
+
+    assert run_async(add(1, 2)) == 3
+
+
+def test_async_cached_distinct_keys():
+    """测试 f(1, 2) 与 f(12) 不会发生缓存键冲突"""
+    calls = []
+
+    @async_cached(ttl=60)
+    async def echo(*args):
+        calls.append(args)
+        return args
+
+    assert echo(1, 2) == (1, 2)
+    assert echo(12) == (12,)
+    assert echo(1, 2) == (1, 2)
+    assert len(calls) == 2
+    assert echo.stats() == {"size": 2, "hits": 1, "misses": 2}
+
+
+def test_async_cached_lru_eviction():
+    """测试超过 maxsize 时淘汰最久未使用的条目"""
+    calls = []
+
+    @async_cached(ttl=60, maxsize=2)
+    async def echo(value):
+        calls.append(value)
+        return value
+
+    echo(1)
+    echo(2)
+    echo(1)  # 1 变为最近使用
+    echo(3)  # 淘汰 2
+    assert echo.stats()["size"] == 2
+
+    echo(1)
+    assert calls == [1, 2, 3]
+    echo(2)
+    assert calls == [1, 2, 3, 2]
+
+    echo.clear_cache()
+    assert echo.stats()["size"] == 0
@@ -0,0 +1,212 @@
+"""
+测试中国CDC爬虫的列表阶段
+
+使用构造的响应对象验证 parse_* 列表解析器的 max_date 过滤，
+以及 crawl() 在列表页下载成功后才查询数据库、把最新日期传给解析器、数据库不可用时不过滤
+"""
+import sys
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+import json
+
+import pytest
+
+import src.data.crawlers.cn_cdc as cn_cdc
+from src.data.crawlers.base import CrawlerResult
+from src.data.crawlers.cn_cdc import NNID_TITLE, ChinaCDCCrawler
+
+MONTHS = [(2024, 1), (2024, 2), (2024, 3)]
+MONTH_NAMES = {1: "January", 2: "February", 3: "March"}
+
+
+def _response(body: str):
+    return SimpleNamespace(text=body, content=body.encode("utf-8"), headers={})
+
+
+def _cdc_weekly_page():
+    links = "".join(
+        f'<a href="/doi/10.46234/ccdcw{y}.{m:03d}">{NNID_TITLE} in China — {MONTH_NAMES[m]} {y}</a>'
+        for y, m in MONTHS
+    )
+    return _response(f"<html><body>{links}</body></html>")
+
+
+def _gov_page():
+    results = [
+        {"source": {"title": f"全国法定传染病疫情概况（{y}年{m}月）",
+                    "urls": json.dumps({"common": f"/jbkzzx/c100016/{y}{m:02d}.html"})}}
+        for y, m in MONTHS
+    ]
+    return _response(json.dumps({"data": {"results": results}}))
+
+
+def _pubmed_feed():
+    items = "".join(
+        f"<item><title>{NNID_TITLE} in China — {MONTH_NAMES[m]} {y}</title>"
+        f"<link>https://pubmed.ncbi.nlm.nih.gov/{y}{m:02d}/</link>"
+        f'<dc:identifier xmlns:dc="http://purl.org/dc/elements/1.1/">pmc:PMC{y}{m:02d}</dc:identifier></item>'
+        for y, m in MONTHS
+    )
+    return _response(f'<?xml version="1.0"?><rss><channel>{items}</channel></rss>')
+
+
+@pytest.fixture
+def crawler():
+    return ChinaCDCCrawler()
+
+
+@pytest.mark.parametrize("parser, response", [
+    ("parse_cdc_weekly", _cdc_weekly_page),
+    ("parse_gov", _gov_page),
+    ("parse_pubmed_rss", _pubmed_feed),
+])
+@pytest.mark.parametrize("max_date, expected", [
+    (None, MONTHS),
+    (date(2024, 1, 1), MONTHS[1:]),
+    (date(2024, 2, 15), MONTHS[2:]),
+    (date(2024, 3, 1), []),
+])
+def test_parse_list_skips_reports_up_to_max_date(crawler, parser, response, max_date, expected):
+    """不晚于 max_date 的报告在解析时跳过，其余报告不受影响"""
+    results = getattr(crawler, parser)(response(), max_date)
+    assert sorted((r.date.year, r.date.month) for r in results) == expected
+
+    # 过滤结果与先全部解析再按日期筛选一致
+    unfiltered = getattr(crawler, parser)(response())
+    cutoff = max_date or date.min
+    assert [r.url for r in results] == [r.url for r in unfiltered if r.date.date() > cutoff]
+
+
+def _fake_get_db(calls, max_time=None, error=None):
+    """替换 cn_cdc.get_db：记录调用次数，返回给定的最新日期或抛出错误"""
+    @asynccontextmanager
+    async def fake_get_db():
+        calls.append(1)
+        if error:
+            raise error
+        yield SimpleNamespace(execute=_async_value(SimpleNamespace(scalar=lambda: max_time)))
+    return fake_get_db
+
+
+def _async_value(value):
+    async def call(*args, **kwargs):
+        return value
+    return call
+
+
+def _list_results():
+    return [
+        CrawlerResult(title=f"{y}-{m}", url=f"https://example.org/{y}/{m}", date=datetime(y, m, 1))
+        for y, m in MONTHS
+    ]
+
+
+def test_crawl_skips_database_when_list_empty(crawler, monkeypatch):
+    """列表为空时不访问数据库"""
+    calls = []
+    monkeypatch.setattr(cn_cdc, "get_db", _fake_get_db(calls, error=ConnectionRefusedError()))
+    monkeypatch.setattr(crawler, "fetch_list", _async_value([]))
+
+    assert asyncio.run(crawler.crawl(source="cdc_weekly")) == []
+    assert calls == []
+
+
+def test_crawl_filters_by_database_max_date(crawler, monkeypatch):
+    """列表非空时查询一次数据库，只保留晚于最新日期的报告"""
+    calls = []
+    monkeypatch.setattr(cn_cdc, "get_db", _fake_get_db(calls, max_time=datetime(2024, 2, 1)))
+    monkeypatch.setattr(crawler, "fetch_list", _async_value(_list_results()))
+
+    results = asyncio.run(crawler.crawl(source="cdc_weekly"))
+    assert [r.title for r in results] == ["2024-3"]
+    assert calls == [1]
+
+
+def test_crawl_without_database_keeps_all_reports(crawler, monkeypatch):
+    """数据库不可用时不过滤，全部报告视为新数据"""
+    calls = []
+    monkeypatch.setattr(cn_cdc, "get_db", _fake_get_db(calls, error=ConnectionRefusedError()))
+    monkeypatch.setattr(crawler, "fetch_list", _async_value(_list_results()))
+
+    results = asyncio.run(crawler.crawl(source="cdc_weekly"))
+    assert [r.title for r in results] == ["2024-1", "2024-2", "2024-3"]
+    assert calls == [1]
+
+
+def _record_parser(crawler, monkeypatch, name, seen):
+    """包装 crawler 的某个 parse_* 方法，记录传入的 max_date"""
+    parser = getattr(crawler, name)
+
+    def recording(response, max_date=None):
+        seen.append(max_date)
+        return parser(response, max_date)
+
+    monkeypatch.setattr(crawler, name, recording)
+
+
+def test_crawl_passes_database_max_date_to_list_parser(crawler, monkeypatch):
+    """crawl() 在列表页下载后查询数据库，解析时即跳过已有的报告"""
+    calls, seen = [], []
+    monkeypatch.setattr(cn_cdc, "get_db", _fake_get_db(calls, max_time=datetime(2024, 2, 1)))
+    monkeypatch.setattr(crawler, "aget", _async_value(_cdc_weekly_page()))
+    _record_parser(crawler, monkeypatch, "parse_cdc_weekly", seen)
+
+    results = asyncio.run(crawler.crawl(source="cdc_weekly"))
+    assert [r.year_month for r in results] == ["2024 March"]
+    assert seen == [date(2024, 2, 1)]
+    assert calls == [1]
+
+
+def test_crawl_force_does_not_filter_list(crawler, monkeypatch):
+    """强制模式不查询数据库，解析时不过滤"""
+    calls, seen = [], []
+    monkeypatch.setattr(cn_cdc, "get_db", _fake_get_db(calls, max_time=datetime(2024, 2, 1)))
+    monkeypatch.setattr(crawler, "aget", _async_value(_cdc_weekly_page()))
+    _record_parser(crawler, monkeypatch, "parse_cdc_weekly", seen)
+
+    results = asyncio.run(crawler.crawl(source="cdc_weekly", force=True))
+    assert len(results) == len(MONTHS)
+    assert seen == [None]
+    assert calls == []
+
+
+def test_failed_list_download_skips_database(crawler, monkeypatch):
+    """列表页下载失败时不访问数据库"""
+    calls = []
+
+    async def failing_get(url, **kwargs):
+        raise ConnectionRefusedError()
+
+    monkeypatch.setattr(cn_cdc, "get_db", _fake_get_db(calls, max_time=datetime(2024, 2, 1)))
+    monkeypatch.setattr(crawler, "aget", failing_get)
+
+    assert asyncio.run(crawler.crawl(source="cdc_weekly")) == []
+    assert calls == []
+
+
+def test_crawl_all_sources_share_one_database_query(crawler, monkeypatch):
+    """三个数据源的列表解析都收到数据库最新日期，且只查询一次数据库"""
+    calls, seen = [], {}
+    pages = {crawler.CDC_WEEKLY_URL: _cdc_weekly_page(), crawler.PUBMED_RSS_URL: _pubmed_feed()}
+
+    async def fake_get(url, **kwargs):
+        return pages[url]
+
+    monkeypatch.setattr(cn_cdc, "get_db", _fake_get_db(calls, max_time=datetime(2024, 2, 1)))
+    monkeypatch.setattr(crawler, "aget", fake_get)
+    monkeypatch.setattr(crawler, "apost", _async_value(_gov_page()))
+    for name in ("parse_cdc_weekly", "parse_gov", "parse_pubmed_rss"):
+        _record_parser(crawler, monkeypatch, name, seen.setdefault(name, []))
+
+    results = asyncio.run(crawler.crawl(source="all"))
+    assert {r.year_month for r in results} == {"2024 March"}
+    assert len(results) == 3
+    assert seen == {name: [date(2024, 2, 1)] for name in seen}
+    assert calls == [1]
@@ -0,0 +1,133 @@
+"""
+测试 BaseCrawler 的条件请求缓存
+
+在本地启动一个支持 ETag 的HTTP服务，验证304时复用缓存内容、
+缓存文件按需创建以及过期和条目上限的清理
+"""
+import sys
+import sqlite3
+import threading
+from contextlib import closing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+import src.data.crawlers.base as crawler_base
+from src.data.crawlers.base import HTTP_CACHE_FILE, BaseCrawler
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """/etag/* 带 ETag 返回内容，If-None-Match 匹配时返回304；其他路径不带校验器"""
+
+    def do_GET(self):
+        self.server.seen.append((self.path, self.headers.get("If-None-Match")))
+        body = f"body of {self.path}".encode("utf-8")
+        etag = f'"{self.path}"'
+        if self.path.startswith("/etag/") and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/etag/"):
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Crawler(BaseCrawler):
+    async def crawl(self, **kwargs):
+        return []
+
+    def parse(self, response):
+        return []
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.seen = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def _crawler(tmp_path, http_cache=True):
+    crawler = _Crawler(delay=0, http_cache=http_cache)
+    if http_cache:
+        crawler._cache_path = tmp_path / HTTP_CACHE_FILE
+    return crawler
+
+
+def _cached_urls(path):
+    with closing(sqlite3.connect(path)) as conn:
+        return sorted(url for (url,) in conn.execute("SELECT url FROM responses"))
+
+
+def test_not_modified_returns_cached_body(server, tmp_path):
+    """第二次请求携带 ETag，服务器返回304时使用缓存的内容"""
+    crawler = _crawler(tmp_path)
+    url = _url(server, "/etag/page")
+
+    first = crawler.get(url)
+    second = crawler.get(url)
+
+    assert server.seen == [("/etag/page", None), ("/etag/page", '"/etag/page"')]
+    assert second.status_code == 200
+    assert second.text == first.text == "body of /etag/page"
+    assert second.headers["ETag"] == '"/etag/page"'
+    # 另一个爬虫实例共享同一个缓存文件
+    assert _crawler(tmp_path).get(url).text == "body of /etag/page"
+
+
+def test_cache_file_created_on_first_cacheable_response(server, tmp_path):
+    """没有校验器的响应不写缓存；未启用缓存时从不创建缓存文件"""
+    cache_file = tmp_path / HTTP_CACHE_FILE
+
+    _crawler(tmp_path).get(_url(server, "/plain"))
+    assert not cache_file.exists()
+
+    disabled = _crawler(tmp_path, http_cache=False)
+    assert disabled._cache_path is None
+    disabled.get(_url(server, "/etag/page"))
+    assert not cache_file.exists()
+
+    _crawler(tmp_path).get(_url(server, "/etag/page"))
+    assert _cached_urls(cache_file) == [_url(server, "/etag/page")]
+
+
+def test_expired_entries_are_refetched(server, tmp_path, monkeypatch):
+    """过期条目不再用于条件请求"""
+    monkeypatch.setattr(crawler_base, "HTTP_CACHE_TTL", -1)
+    crawler = _crawler(tmp_path)
+    url = _url(server, "/etag/page")
+
+    crawler.get(url)
+    assert crawler.get(url).text == "body of /etag/page"
+    assert server.seen == [("/etag/page", None), ("/etag/page", None)]
+
+
+def test_cache_keeps_most_recent_entries(server, tmp_path, monkeypatch):
+    """超过条目上限时删除最旧的条目"""
+    monkeypatch.setattr(crawler_base, "HTTP_CACHE_MAX_ENTRIES", 2)
+    crawler = _crawler(tmp_path)
+
+    for name in ("a", "b", "c"):
+        crawler.get(_url(server, f"/etag/{name}"))
+
+    assert _cached_urls(tmp_path / HTTP_CACHE_FILE) == [_url(server, "/etag/b"), _url(server, "/etag/c")]
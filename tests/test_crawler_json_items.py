@@ -0,0 +1,70 @@
+"""
+测试 BaseCrawler.iter_json_items
+
+在本地启动HTTP服务返回JSON列表，分别以流式和非流式请求读取，
+两种方式产出的元素都应与整体解析的结果一致
+"""
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.data.crawlers.base import BaseCrawler
+
+PAYLOAD = {"data": {"results": [{"id": i, "title": f"报告 {i}"} for i in range(50)]}}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps(PAYLOAD, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Crawler(BaseCrawler):
+    async def crawl(self, **kwargs):
+        return []
+
+    def parse(self, response):
+        return []
+
+
+@pytest.fixture
+def url():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/list"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_iter_json_items(url, stream):
+    """流式和非流式响应都能逐个产出数组元素"""
+    crawler = _Crawler(delay=0)
+    response = crawler.get(url, stream=stream)
+
+    items = list(crawler.iter_json_items(response, "data.results.item"))
+    assert items == PAYLOAD["data"]["results"]
+
+
+def test_iter_json_items_after_content_read(url):
+    """流式请求的响应体已被读取后仍可解析"""
+    crawler = _Crawler(delay=0)
+    response = crawler.get(url, stream=True)
+    assert response.content
+
+    assert list(crawler.iter_json_items(response, "data.results.item")) == PAYLOAD["data"]["results"]
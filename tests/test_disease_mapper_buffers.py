@@ -0,0 +1,140 @@
+"""
+测试疾病映射器的统计缓冲写回
+
+使用内存中的假数据库会话，验证缓冲的使用统计和未知疾病
+在一批数据（少于写回阈值）处理完成后确实写入数据库
+"""
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+import src.data.normalizers.disease_mapper_db as mapper_module
+from src.data.normalizers.disease_mapper_db import STATS_FLUSH_THRESHOLD, DiseaseMapperDB, DiseaseMapperDBSync
+from src.data.processors.data_processor import DataProcessor
+
+MAPPINGS = {"鼠疫": "D001", "霍乱": "D002"}
+STANDARDS = {
+    "D001": ("D001", "Plague", "鼠疫", "Bacterial", "A20", "1B90", None),
+    "D002": ("D002", "Cholera", "霍乱", "Bacterial", "A00", "1A00", None),
+}
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+
+class _FakeSession:
+    """只识别映射器用到的几条SQL，记录所有写操作"""
+
+    def __init__(self, writes):
+        self._writes = writes
+
+    async def execute(self, statement, params=None):
+        sql = " ".join(str(statement).split())
+        if sql.startswith("UPDATE") or sql.startswith("INSERT"):
+            self._writes.append((sql.split()[0], dict(zip(params["names"], params["counts"]))))
+            return _Result([])
+        if "ANY(:names)" in sql:
+            return _Result([(name,) + STANDARDS[MAPPINGS[name]] for name in params["names"] if name in MAPPINGS])
+        if "ANY(:ids)" in sql:
+            return _Result([STANDARDS[i] for i in params["ids"] if i in STANDARDS])
+        return _Result([])
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def db_writes(monkeypatch):
+    """替换映射器模块的 get_db，返回记录写操作的列表"""
+    writes = []
+
+    @asynccontextmanager
+    async def fake_get_db():
+        yield _FakeSession(writes)
+
+    monkeypatch.setattr(mapper_module, "get_db", fake_get_db)
+    return writes
+
+
+def _writes_by_kind(writes):
+    return {kind: counts for kind, counts in writes}
+
+
+def test_small_batch_is_buffered_until_flush(db_writes):
+    """少于阈值的一批查询在 flush 前不写库，退出 async with 时写回"""
+    names = ["鼠疫", "霍乱", "鼠疫", "未知病"]
+    assert len(set(names)) < STATS_FLUSH_THRESHOLD
+
+    async def run():
+        async with DiseaseMapperDB("cn") as mapper:
+            ids = await mapper.batch_map_local_to_id(names)
+            assert db_writes == []
+            return ids
+
+    assert asyncio.run(run()) == ["D001", "D002", "D001", None]
+    writes = _writes_by_kind(db_writes)
+    assert writes["UPDATE"] == {"鼠疫": 1, "霍乱": 1}
+    assert writes["INSERT"] == {"未知病": 1}
+
+
+def test_data_processor_flushes_per_report(db_writes, tmp_path):
+    """DataProcessor 每处理完一份报告即写回映射器的缓冲"""
+    processor = DataProcessor(output_dir=tmp_path)
+    mapper = DiseaseMapperDB("cn")
+    df = pd.DataFrame({"DiseasesCN": ["鼠疫", "霍乱", "鼠疫", "未知病"], "Cases": [1, 2, 3, 4]})
+
+    result = asyncio.run(processor._normalize_disease_names(df, language="zh", disease_mapper=mapper))
+
+    assert list(result["Diseases"]) == ["Plague", "Cholera", "Plague"]
+    # map_dataframe 对去重后的名称各查询一次
+    writes = _writes_by_kind(db_writes)
+    assert writes["UPDATE"] == {"鼠疫": 1, "霍乱": 1}
+    assert writes["INSERT"] == {"未知病": 1}
+    assert not mapper._usage_buffer and not mapper._unknown_buffer
+
+
+def test_unknown_diseases_flushed_per_report(db_writes, tmp_path):
+    """每份报告各用一个映射器，未知疾病在各自报告结束时写入建议表"""
+    processor = DataProcessor(output_dir=tmp_path)
+    reports = [
+        pd.DataFrame({"DiseasesCN": ["鼠疫", "未知病"], "Cases": [1, 2]}),
+        pd.DataFrame({"DiseasesCN": ["未知病", "另一种病"], "Cases": [3, 4]}),
+    ]
+
+    async def run():
+        for df in reports:
+            await processor._normalize_disease_names(df, language="zh", disease_mapper=DiseaseMapperDB("cn"))
+
+    asyncio.run(run())
+
+    inserts = [counts for kind, counts in db_writes if kind == "INSERT"]
+    assert inserts == [{"未知病": 1}, {"未知病": 1, "另一种病": 1}]
+
+
+def test_sync_wrapper_flushes_on_exit(db_writes):
+    """同步包装器退出 with 时写回缓冲，flush() 可随时手动写回"""
+    with DiseaseMapperDBSync("cn") as mapper:
+        assert mapper.map_many(["鼠疫", "未知病"]) == ["D001", None]
+        assert db_writes == []
+    assert _writes_by_kind(db_writes) == {"UPDATE": {"鼠疫": 1}, "INSERT": {"未知病": 1}}
+
+    db_writes.clear()
+    mapper.map_many(["霍乱"])
+    mapper.flush()
+    assert _writes_by_kind(db_writes) == {"UPDATE": {"霍乱": 1}}
@@ -0,0 +1,34 @@
+"""
+测试 DiseaseMapper.standard_diseases 兼容视图
+
+视图与逐个调用 get_standard_disease 的结果一致，且不能被修改
+"""
+import sys
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.data.normalizers.disease_mapper import DiseaseMapper
+
+
+def test_standard_diseases_view_matches_lookup():
+    """按键查找、遍历和长度与列数据一致"""
+    mapper = DiseaseMapper.get("cn")
+    view = mapper.standard_diseases
+
+    assert len(view) == mapper.get_statistics()["standard_diseases_count"] > 0
+    for disease_id in view:
+        assert view[disease_id] == mapper.get_standard_disease(disease_id)
+    assert "D-missing" not in view
+    assert view.get("D-missing") is None
+    with pytest.raises(KeyError):
+        view["D-missing"]
+
+
+def test_standard_diseases_view_is_read_only():
+    mapper = DiseaseMapper.get("cn")
+    with pytest.raises(TypeError):
+        mapper.standard_diseases["D001"] = None
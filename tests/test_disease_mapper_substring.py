@@ -0,0 +1,75 @@
+"""
+测试 DiseaseMapper 的子串匹配建议
+
+嵌在较长文本中的已知名称只作为审核建议记录，不作为映射结果返回；
+短名称、泛称和不在词边界上的名称不产生建议
+"""
+import sys
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+import pytest
+
+from src.data.normalizers.disease_mapper import DiseaseMapper
+
+# 这些名称在子串匹配下曾被误判为其他疾病
+MISLEADING_NAMES = [
+    ("cn", "SARS-CoV-2"),
+    ("cn", "流感嗜血杆菌"),
+    ("cn", "流行性感冒相关死亡"),
+    ("cn", "登革出血热"),
+    ("en", "SARS-CoV-2"),
+    ("us", "Hepatitis D"),
+    ("us", "Hepatitis E"),
+]
+
+
+@pytest.mark.parametrize("substring_match", [False, True])
+@pytest.mark.parametrize("country_code, name", MISLEADING_NAMES)
+def test_embedded_names_are_not_mapped(country_code, name, substring_match):
+    """嵌有其他病名的名称仍记为未识别，不返回disease_id"""
+    mapper = DiseaseMapper.get(country_code, substring_match=substring_match)
+
+    assert mapper.map_local_to_id(name) is None
+    assert name in mapper.get_unknown_diseases()
+
+    df = mapper.map_dataframe(pd.DataFrame({"name": [name]}), source_col="name")
+    assert df["disease_id"].tolist() == [None]
+
+
+@pytest.mark.parametrize("country_code, name", [
+    ("cn", "SARS-CoV-2"),     # 不在词边界上
+    ("en", "SARS-CoV-2"),
+    ("cn", "流感嗜血杆菌"),    # "流感" 过短
+    ("cn", "登革出血热"),      # "出血热" 是多种疾病的泛称
+    ("us", "Hepatitis D"),    # "Hepatitis" 是多种肝炎的泛称
+    ("us", "Hepatitis E"),
+])
+def test_unreliable_substrings_give_no_suggestion(country_code, name):
+    """短名称、泛称和词中间的名称不产生建议"""
+    mapper = DiseaseMapper.get(country_code, substring_match=True)
+    mapper.map_local_to_id(name)
+    assert mapper.substring_suggestions == {}
+
+
+def test_substring_hit_is_recorded_for_review(tmp_path):
+    """可靠的子串命中只记录为建议，并随未识别疾病一起导出"""
+    mapper = DiseaseMapper.get("cn", substring_match=True)
+    name = "流行性感冒相关死亡"
+
+    assert mapper.map_local_to_id(name) is None
+    assert mapper.substring_suggestions == {name: mapper.map_local_to_id("流行性感冒")}
+
+    output = tmp_path / "unknown.csv"
+    mapper.export_unknown_diseases(output)
+    assert f"{mapper.substring_suggestions[name]},{name}," in output.read_text(encoding="utf-8")
+
+
+def test_substring_match_is_opt_in():
+    """默认不做子串匹配"""
+    mapper = DiseaseMapper.get("cn")
+    mapper.map_local_to_id("流行性感冒相关死亡")
+    assert mapper.substring_suggestions == {}
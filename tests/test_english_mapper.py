@@ -0,0 +1,120 @@
+"""
+测试英文疾病名称模糊匹配的字典树预筛选
+
+随机生成名称和带编辑扰动的查询，与逐个候选计算相似度的暴力扫描对比：
+字典树不能漏掉任何相似度达到阈值的名称，模糊匹配结果必须与暴力扫描一致
+"""
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+import random
+
+import pytest
+
+import src.data.normalizers.english_mapper as english_mapper
+from src.data.normalizers.english_mapper import (
+    EnglishDiseaseMapper,
+    _build_trie,
+    _normalize,
+    _search_trie,
+)
+
+ALPHABET = "abcdeh t,"
+
+
+def _random_names(rng, count, max_length):
+    names = ("".join(rng.choice(ALPHABET) for _ in range(rng.randint(3, max_length))) for _ in range(count))
+    return [name.strip() or "x" for name in names]
+
+
+def _perturb(rng, name, max_edits):
+    """随机插入或删除若干字符"""
+    letters = list(name)
+    for _ in range(rng.randint(0, max_edits)):
+        i = rng.randrange(len(letters) + 1)
+        if rng.random() < 0.5:
+            letters.insert(i, rng.choice(ALPHABET))
+        elif letters:
+            letters.pop(min(i, len(letters) - 1))
+    return "".join(letters) or "a"
+
+
+@pytest.fixture
+def mapper():
+    return EnglishDiseaseMapper("CN")
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_trie_keeps_every_similar_name(mapper, seed):
+    """字典树返回的候选包含所有相似度不低于阈值的名称"""
+    rng = random.Random(seed)
+    names = [_normalize(name) for name in _random_names(rng, 300, 16)]
+    pairs = list(zip(names[::2], names[1::2]))
+    trie = _build_trie(pairs)
+
+    for _ in range(100):
+        query = _normalize(_perturb(rng, rng.choice(names), 4))
+        expected = {
+            (index, kind)
+            for index, pair in enumerate(pairs)
+            for kind, name in enumerate(pair)
+            if name == query or mapper._calculate_similarity(query, name) >= 0.85
+        }
+        assert expected <= set(_search_trie(trie, query)), query
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+def _brute_force_match(mapper, rows, query):
+    """逐个候选校验并按（相似度，优先级）取最佳，不使用字典树和缓存"""
+    norm_query = _normalize(query)
+    matches = []
+    for disease_id, local_name, standard_name, priority in rows:
+        for name in (local_name, standard_name):
+            norm_name = _normalize(name)
+            valid, similarity = mapper._is_valid_match(norm_query, norm_name)
+            if valid:
+                matches.append((1.0 if norm_name == norm_query else similarity, priority, disease_id))
+    if not matches:
+        return None
+    return max(matches, key=lambda m: (m[0], m[1]))[2]
+
+
+def test_fuzzy_match_agrees_with_brute_force(mapper, monkeypatch):
+    """模糊匹配（字典树预筛选 + 批量打分）与暴力扫描结果一致"""
+    rng = random.Random(2)
+    words = _random_names(rng, 400, 25)
+    rows = sorted(
+        ((f"D{i}", local, standard, rng.randint(0, 3)) for i, (local, standard) in enumerate(zip(words[::2], words[1::2]))),
+        key=lambda row: -row[3],
+    )
+
+    @asynccontextmanager
+    async def fake_get_db():
+        class _Session:
+            async def execute(self, statement, params=None):
+                return _Result(rows)
+        yield _Session()
+
+    monkeypatch.setattr(english_mapper, "get_db", fake_get_db)
+
+    queries = [_perturb(rng, rng.choice(words), 3) for _ in range(150)]
+
+    async def run():
+        return [await mapper.fuzzy_match_english(query) for query in queries]
+
+    results = asyncio.run(run())
+    expected = [_brute_force_match(mapper, rows, query) for query in queries]
+    assert results == expected
+    assert any(result is not None for result in results)